@@ -0,0 +1,93 @@
+"""
+Benchmarks for the bookkeeping done by `mpl_gui.FigureRegistry`.
+
+Run as a script, this prints the mean time to create and register a Figure
+with registries that already hold an increasing number of Figures.  The
+times should stay flat as the registry grows.  With ``--memory`` it instead
+prints the bytes the registry retains per registered Figure.
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+
+# ensure no pyplot!
+assert sys.modules.get("matplotlib.pyplot", None) is None
+sys.modules["matplotlib.pyplot"] = None
+
+import mpl_gui as mg  # noqa: E402
+
+
+def time_figure_creation(n_existing, n_sample=200):
+    """
+    Return the mean seconds per `FigureRegistry.figure` call.
+
+    The cyclic garbage collector is disabled while timing (as `timeit`
+    does), otherwise its passes over the existing Figures would be counted
+    and grow with them.
+    """
+    fr = mg.FigureRegistry(block=False)
+    with mg.ioff():
+        for _ in range(n_existing):
+            fr.figure()
+        gc.collect()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(n_sample):
+                fr.figure()
+            return (time.perf_counter() - start) / n_sample
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+
+def bytes_per_registered_figure(n):
+    """Return the mean bytes allocated (and kept) by registering a Figure."""
+    figs = [mg.Figure() for _ in range(n)]
+    fr = mg.FigureRegistry(block=False)
+    with mg.ioff():
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            fr._register_figs(figs)
+            gc.collect()
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return (after - before) / n
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1_000, 10_000, 100_000],
+        help="Number of Figures already registered before timing.",
+    )
+    parser.add_argument(
+        "--sample", type=int, default=200, help="Number of Figures to time."
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Report the bytes retained per registered Figure instead.",
+    )
+    args = parser.parse_args(argv)
+    if args.memory:
+        print(f"{'registered':>12} {'bytes / figure':>15}")
+        for n in args.sizes:
+            print(f"{n:>12d} {bytes_per_registered_figure(n):>15.0f}")
+        return
+    print(f"{'registered':>12} {'us / figure':>12}")
+    for n in args.sizes:
+        print(f"{n:>12d} {time_figure_creation(n, args.sample) * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
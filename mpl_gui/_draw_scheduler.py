@@ -0,0 +1,165 @@
+"""Coalesce the redraws requested by stale Figures to a fixed frame rate."""
+
+import time
+import weakref
+
+from matplotlib.backend_bases import FigureCanvasBase, TimerBase
+
+
+_scheduler = None
+
+
+class DrawScheduler:
+    """
+    Merge redraw requests and draw each dirty Figure at most once per frame.
+
+    Requests that arrive for a Figure that is already waiting to be drawn are
+    dropped.  The pending Figures are drawn by a single-shot timer on the GUI
+    event loop no sooner than one frame after the previous flush.  Figures
+    whose canvas has no timer that actually runs are not coalesced.
+
+    Parameters
+    ----------
+    fps : float
+        The maximum number of times per second the dirty Figures are drawn.
+
+    Attributes
+    ----------
+    requested : int
+        The number of redraws requested.
+    drawn : int
+        The number of redraws actually issued.
+    dropped : int
+        The number of requests merged into an already pending redraw.
+    """
+
+    def __init__(self, fps):
+        self.fps = fps
+        # insertion ordered set of the Figures waiting to be drawn
+        self._dirty = weakref.WeakKeyDictionary()
+        self._timer = None
+        # the Figure on whose canvas the timer runs
+        self._timer_fig = None
+        self._last_flush = float("-inf")
+        self.requested = 0
+        self.drawn = 0
+        self.dropped = 0
+
+    def request(self, fig):
+        """
+        Mark *fig* as needing a redraw on the next frame.
+
+        Returns False, without doing anything, if the redraw can not be
+        coalesced and has to be done by the caller.
+        """
+        if not _has_timer(fig.canvas):
+            return False
+        self.requested += 1
+        if fig in self._dirty:
+            self.dropped += 1
+            return True
+        self._dirty[fig] = None
+        owner = self._timer_fig() if self._timer_fig is not None else None
+        if owner is None or not _has_timer(owner.canvas):
+            # the canvas the timer was on is gone, and the timer with it
+            self._start_timer(fig)
+        return True
+
+    def discard(self, fig):
+        """
+        Forget *fig*, which has been closed or demoted.
+
+        If the timer was on its canvas it is moved to the canvas of another
+        pending Figure.
+        """
+        self._dirty.pop(fig, None)
+        owner = self._timer_fig() if self._timer_fig is not None else None
+        if owner is fig or owner is None:
+            self._start_timer(
+                next((f for f in self._dirty if _has_timer(f.canvas)), None)
+            )
+
+    def _start_timer(self, fig):
+        if self._timer is not None:
+            self._timer.stop()
+        self._timer = self._timer_fig = None
+        if fig is None:
+            return
+        wait = self._last_flush + 1 / self.fps - time.monotonic()
+        self._timer = fig.canvas.new_timer(interval=int(max(0, wait) * 1000))
+        self._timer.single_shot = True
+        self._timer.add_callback(self.flush)
+        self._timer.start()
+        self._timer_fig = weakref.ref(fig)
+
+    def flush(self):
+        """Draw all of the pending Figures now."""
+        if self._timer is not None:
+            self._timer.stop()
+        self._timer = self._timer_fig = None
+        self._last_flush = time.monotonic()
+        dirty, self._dirty = self._dirty, weakref.WeakKeyDictionary()
+        for fig in list(dirty):
+            canvas = fig.canvas
+            # the figure may have been closed or demoted while waiting
+            if canvas.manager is None:
+                continue
+            with canvas._idle_draw_cntx():
+                canvas.draw_idle()
+            self.drawn += 1
+
+    def stats(self):
+        """Return the request counters as a dict."""
+        return {
+            "requested": self.requested,
+            "drawn": self.drawn,
+            "dropped": self.dropped,
+            "pending": len(self._dirty),
+        }
+
+
+def _has_timer(canvas):
+    # only promoted canvases are on an event loop, and TimerBase (used by
+    # e.g. the Agg canvas) never fires.  Some backends (tk) override
+    # new_timer rather than setting _timer_cls
+    return canvas.manager is not None and (
+        type(canvas).new_timer is not FigureCanvasBase.new_timer
+        or canvas._timer_cls._timer_start is not TimerBase._timer_start
+    )
+
+
+def current_draw_scheduler():
+    """Return the active `DrawScheduler` or None if redraws are not coalesced."""
+    return _scheduler
+
+
+def enable_draw_coalescing(fps=30):
+    """
+    Coalesce the automatic redraws of stale Figures to at most *fps* per second.
+
+    By default, in interactive mode, every time a promoted Figure goes stale
+    ``draw_idle`` is called on its canvas.  When enabled, the stale Figures
+    are instead collected and each is redrawn at most once per frame.
+
+    Parameters
+    ----------
+    fps : float, default: 30
+        The maximum frame rate.
+
+    Returns
+    -------
+    DrawScheduler
+        The scheduler, which counts the requested, drawn and dropped redraws.
+    """
+    global _scheduler
+    disable_draw_coalescing()
+    _scheduler = DrawScheduler(fps)
+    return _scheduler
+
+
+def disable_draw_coalescing():
+    """Go back to redrawing stale Figures right away, after a final flush."""
+    global _scheduler
+    if _scheduler is not None:
+        _scheduler.flush()
+    _scheduler = None
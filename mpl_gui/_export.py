@@ -0,0 +1,93 @@
+"""Render Figures to files in parallel, independent of any GUI canvas."""
+
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+import itertools
+import pickle
+import re
+
+
+_executors = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+
+def _safe_name(label):
+    return re.sub(r"[^\w.-]+", "_", label).strip("_")
+
+
+def _save_agg(fig, path, savefig_kw):
+    # backend="agg" renders on a temporary Agg canvas so that the GUI canvas
+    # (if any) is never drawn to from a worker
+    fig.savefig(path, backend="agg", **savefig_kw)
+    return path
+
+
+def export_figures(items, *, workers=None, executor="thread", **savefig_kw):
+    """
+    Save Figures with a pool of workers, yielding each as it is written.
+
+    Only about as many Figures as there are workers are handed to the pool
+    at a time, the next ones are handed over as the results are iterated
+    over.
+
+    Parameters
+    ----------
+    items : iterable of (Figure, path)
+        The Figures to save and where to save them.
+
+    workers : int, optional
+        The number of workers, defaults to the executor's default.
+
+    executor : {"thread", "process"}, default: "thread"
+        Render in a thread pool or in a process pool.  With threads a copy
+        of each Figure is made (by pickling it, on the calling thread) just
+        before it is handed to a worker, so the Figures themselves are never
+        touched from another thread.  With processes the Figures are pickled to the workers, so
+        rendering is not limited by the GIL.  Either way the Figures (and
+        their artists) must be picklable.
+
+    **savefig_kw
+        Passed to `~matplotlib.figure.Figure.savefig`.
+
+    Returns
+    -------
+    iterator of (Figure, path)
+        In the order the files are finished.  The work on the first
+        Figures is started before this returns.
+    """
+    try:
+        pool = _executors[executor](max_workers=workers)
+    except KeyError:
+        raise ValueError(
+            f"executor must be one of {sorted(_executors)!r}, not {executor!r}"
+        ) from None
+    copy = executor == "thread"
+    items = iter(items)
+    # submit the first batch now so the work starts even if the results are
+    # not iterated over right away
+    futures = {}
+    for fig, path in itertools.islice(items, pool._max_workers):
+        futures[_submit(pool, fig, path, savefig_kw, copy)] = fig
+    return _iter_completed(pool, futures, items, savefig_kw, copy)
+
+
+def _submit(pool, fig, path, savefig_kw, copy):
+    if copy:
+        # savefig swaps the canvas of the Figure it renders, which must not
+        # happen to a Figure the GUI (or the user) may be using concurrently
+        fig = pickle.loads(pickle.dumps(fig))
+    return pool.submit(_save_agg, fig, path, savefig_kw)
+
+
+def _iter_completed(pool, futures, items, savefig_kw, copy):
+    with pool:
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                # keep the pool busy while the caller handles this result
+                for fig, path in itertools.islice(items, 1):
+                    futures[_submit(pool, fig, path, savefig_kw, copy)] = fig
+                yield futures.pop(future), future.result()
@@ -1,16 +1,51 @@
 import importlib
+import importlib.util
+import json
+import os
 import sys
 import logging
+import time
 import types
+import weakref
 
+import matplotlib as mpl
 from matplotlib import cbook, rcsetup
 from matplotlib import rcParams, rcParamsDefault
 from matplotlib.backends.registry import backend_registry
 import matplotlib.backend_bases
 
+from ._render_cache import refresh_canvas
+
 
 _backend_mod = None
 
+# lower-cased backend name -> (BackendClass, rcParams string).  Building
+# the class is not free and the FigureManager class needs to stay the same
+# for promote_figure's type check if we switch away and back.
+_backend_cache = {}
+
+# the last (IPython shell, framework) we asked IPython to integrate with
+_ipython_gui = None
+
+# backends that we ship in mpl_gui._patched_backends
+_patched_backends = {"tkagg", "headless"}
+
+# auto-backend candidate -> modules of which at least one must be installed
+_candidate_modules = {
+    "macosx": ("matplotlib.backends._macosx",),
+    "qtagg": ("PyQt6", "PySide6", "PyQt5", "PySide2"),
+    "gtk3agg": ("gi",),
+    "gtk4agg": ("gi",),
+    "tkagg": ("_tkinter",),
+    "wxagg": ("wx",),
+}
+
+# environment variable to opt in to caching the auto-selected backend on disk
+_TOOLKIT_CACHE_ENV = "MPLGUI_TOOLKIT_CACHE"
+
+# manager -> weakref to the Figure it was last shown with
+_shown_managers = weakref.WeakKeyDictionary()
+
 _log = logging.getLogger(__name__)
 
 
@@ -27,6 +62,208 @@ def current_backend_module():
     return _backend_mod
 
 
+def _probe(candidate):
+    """
+    Return why the auto-backend *candidate* can not work, or None if it might.
+
+    This only looks at the platform, the environment and which modules could
+    be imported, it does not import anything.
+    """
+    if candidate not in _candidate_modules:
+        # not a GUI backend we know how to probe, so it is up to the import
+        return None
+    if candidate == "macosx" and sys.platform != "darwin":
+        return "not on macOS"
+    if sys.platform not in ("darwin", "win32") and not (
+        os.environ.get("DISPLAY")
+        or os.environ.get("WAYLAND_DISPLAY")
+        # Qt can render without a display server, e.g. with "offscreen"
+        or (candidate == "qtagg" and os.environ.get("QT_QPA_PLATFORM"))
+    ):
+        return "neither DISPLAY nor WAYLAND_DISPLAY is set"
+    modules = _candidate_modules[candidate]
+    if not any(importlib.util.find_spec(m) for m in modules):
+        return f"none of {', '.join(modules)} is installed"
+    return None
+
+
+def _toolkit_cache_path():
+    return os.path.join(mpl.get_cachedir(), "mpl_gui_toolkit.json")
+
+
+def _toolkit_cache_key():
+    """
+    Return what the auto-selected backend depends on, or None if not caching.
+
+    The toolkits are identified by where they are installed and when that
+    was last modified, which changes when they are (un)installed or upgraded
+    and is much cheaper to check than reading the package metadata.
+    """
+    if os.environ.get(_TOOLKIT_CACHE_ENV, "0") in ("", "0"):
+        return None
+    modules = {}
+    for names in _candidate_modules.values():
+        for name in names:
+            spec = importlib.util.find_spec(name)
+            origin = spec.origin if spec is not None else None
+            try:
+                mtime = os.stat(origin).st_mtime_ns if origin else None
+            except OSError:
+                mtime = None
+            modules[name] = [origin, mtime]
+    return {
+        "executable": sys.executable,
+        "python": sys.version,
+        "platform": sys.platform,
+        "matplotlib": mpl.__version__,
+        "env": {
+            k: os.environ.get(k) for k in ("DISPLAY", "WAYLAND_DISPLAY", "QT_QPA_PLATFORM")
+        },
+        "modules": modules,
+    }
+
+
+def _read_toolkit_cache(key):
+    """Return the cached backend name if it was stored with *key*."""
+    if key is None:
+        return None
+    try:
+        with open(_toolkit_cache_path(), encoding="utf-8") as fin:
+            cached = json.load(fin)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    return cached.get("backend")
+
+
+def _write_toolkit_cache(key, backend):
+    if key is None:
+        return
+    path = _toolkit_cache_path()
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as fout:
+            json.dump({"key": key, "backend": backend}, fout)
+        os.replace(tmp, path)
+    except OSError as e:
+        _log.debug("Could not write the toolkit cache %s: %s", path, e)
+
+
+def _backend_module_name(newbackend):
+    """Return the name of the module implementing the backend *newbackend*."""
+    if newbackend.lower() in _patched_backends:
+        return f"mpl_gui._patched_backends.{newbackend.lower()}"
+    return backend_registry._backend_module_name(newbackend)
+
+
+def _auto_candidates():
+    """
+    Return the backends to try, in order, for the auto backend sentinel.
+
+    Also returns the backend of the interactive framework that is already
+    running (None if there is none), the toolkit cache key and the cached
+    backend name (both None if the cache is not used).
+    """
+    current_framework = cbook._get_running_interactive_framework()
+    mapping = {
+        "qt": "qtagg",
+        "gtk3": "gtk3agg",
+        "gtk4": "gtk4agg",
+        "wx": "wxagg",
+        "tk": "tkagg",
+        "macosx": "macosx",
+        "headless": "agg",
+    }
+
+    best_guess = mapping.get(current_framework, None)
+    cache_key = cached = None
+    if best_guess is not None:
+        candidates = [best_guess]
+    else:
+        # with no framework running, try what we picked last time first
+        cache_key = _toolkit_cache_key()
+        cached = _read_toolkit_cache(cache_key)
+        candidates = [cached] if cached is not None else []
+    candidates += ["macosx", "qtagg", "gtk3agg", "tkagg", "wxagg"]
+    return candidates, best_guess, cache_key, cached
+
+
+def show_and_refresh(managers):
+    """
+    Show the managers that are not shown yet and redraw the stale Figures.
+
+    Managers that are already showing their Figure are not shown again and
+    their Figures are only redrawn if they are stale, so showing a growing
+    set of Figures over and over only costs a check for the old ones.
+    """
+    new = []
+    for manager in managers:
+        ref = _shown_managers.get(manager)
+        if (
+            ref is None
+            or ref() is not manager.canvas.figure
+            # hidden, e.g. by the manager pool
+            or not getattr(manager, "_shown", True)
+        ):
+            new.append(manager)
+    for manager in new:
+        manager.show()  # Emits a warning for non-interactive backend
+        _shown_managers[manager] = weakref.ref(manager.canvas.figure)
+    # draw once all are shown, so that only the tab shown last is drawn if
+    # the managers share a tabbed window
+    new = set(new)
+    for manager in managers:
+        if manager in new or manager.canvas.figure.stale:
+            refresh_canvas(manager.canvas)
+
+
+def _build_backend_class(newbackend):
+    """Import the backend *newbackend* and build our class around it."""
+    # Backends are implemented as modules, but "inherit" default method
+    # implementations from backend_bases._Backend.  This is achieved by
+    # creating a "class" that inherits from backend_bases._Backend and whose
+    # body is filled with the module's globals.
+
+    backend_name = _backend_module_name(newbackend)
+    mod = importlib.import_module(backend_name)
+    if hasattr(mod, "Backend"):
+        orig_class = mod.Backend
+
+    else:
+
+        class orig_class(matplotlib.backend_bases._Backend):
+            locals().update(vars(mod))
+
+            @classmethod
+            def mainloop(cls):
+                return mod.Show().mainloop()
+
+    class BackendClass(orig_class):
+        @classmethod
+        def show_managers(cls, *, managers, block):
+            if not managers:
+                return
+            show_and_refresh(managers)
+            if cls.mainloop is None:
+                return
+            if block:
+                try:
+                    cls.FigureManager._active_managers = managers
+                    cls.mainloop()
+                finally:
+                    cls.FigureManager._active_managers = None
+
+    if not hasattr(BackendClass.FigureManager, "_active_managers"):
+        BackendClass.FigureManager._active_managers = None
+    if backend_registry.is_valid_backend(newbackend):
+        rc_params_string = newbackend
+    else:
+        # our own backends that Matplotlib does not know the name of
+        rc_params_string = f"module://{backend_name}"
+    return BackendClass, rc_params_string
+
+
 def select_gui_toolkit(newbackend=None):
     """
     Select the GUI toolkit to use.
@@ -40,94 +277,80 @@ def select_gui_toolkit(newbackend=None):
     newbackend : Union[str, _Backend]
         The name of the backend to use or a _Backend class to use.
 
+        In addition to the Matplotlib backends, ``"headless"`` selects a
+        backend with no GUI which only counts (and times) the calls made to
+        it, see ``mpl_gui._patched_backends.headless.calls``.
+
     Returns
     -------
     _Backend
        The backend selected.
 
+    Notes
+    -----
+    If the environment variable ``MPLGUI_TOOLKIT_CACHE`` is set (to anything
+    but "0"), the backend picked automatically is stored in Matplotlib's cache
+    directory and tried first in later processes, as long as the Python
+    interpreter, the installed GUI toolkits and the display environment are
+    unchanged.
+
     """
-    global _backend_mod
+    global _backend_mod, _ipython_gui
 
     # work-around the sentinel resolution in Matplotlib 😱
     if newbackend is None:
         newbackend = dict.__getitem__(rcParams, "backend")
 
     if newbackend is rcsetup._auto_backend_sentinel:
-        current_framework = cbook._get_running_interactive_framework()
-        mapping = {
-            "qt": "qtagg",
-            "gtk3": "gtk3agg",
-            "gtk4": "gtk4agg",
-            "wx": "wxagg",
-            "tk": "tkagg",
-            "macosx": "macosx",
-            "headless": "agg",
-        }
-
-        best_guess = mapping.get(current_framework, None)
-        if best_guess is not None:
-            candidates = [best_guess]
-        else:
-            candidates = []
-        candidates += ["macosx", "qtagg", "gtk3agg", "tkagg", "wxagg"]
+        candidates, running, cache_key, cached = _auto_candidates()
 
         # Don't try to fallback on the cairo-based backends as they each have
         # an additional dependency (pycairo) over the agg-based backend, and
         # are of worse quality.
         for candidate in candidates:
+            start = time.perf_counter()
+            # the toolkit of a running event loop is known to work, whatever
+            # the environment looks like
+            reason = None if candidate == running else _probe(candidate)
+            if reason is not None:
+                _log.debug(
+                    "Skipped backend %s in %.2f ms: %s",
+                    candidate,
+                    (time.perf_counter() - start) * 1000,
+                    reason,
+                )
+                continue
             try:
-                return select_gui_toolkit(candidate)
-            except ImportError:
+                backend = select_gui_toolkit(candidate)
+            except ImportError as e:
+                _log.debug(
+                    "Failed to load backend %s in %.2f ms: %s",
+                    candidate,
+                    (time.perf_counter() - start) * 1000,
+                    e,
+                )
                 continue
+            _log.debug(
+                "Selected backend %s in %.2f ms",
+                candidate,
+                (time.perf_counter() - start) * 1000,
+            )
+            if candidate != cached:
+                _write_toolkit_cache(cache_key, candidate)
+            return backend
 
         # Switching to Agg should always succeed; if it doesn't, let the
         # exception propagate out.
-        return select_gui_toolkit("agg")
+        backend = select_gui_toolkit("agg")
+        if cached != "agg":
+            _write_toolkit_cache(cache_key, "agg")
+        return backend
 
     if isinstance(newbackend, str):
-        # Backends are implemented as modules, but "inherit" default method
-        # implementations from backend_bases._Backend.  This is achieved by
-        # creating a "class" that inherits from backend_bases._Backend and whose
-        # body is filled with the module's globals.
-
-        if newbackend.lower() == "tkagg":
-            backend_name = f"mpl_gui._patched_backends.{newbackend.lower()}"
-        else:
-            backend_name = backend_registry._backend_module_name(newbackend)
-
-        mod = importlib.import_module(backend_name)
-        if hasattr(mod, "Backend"):
-            orig_class = mod.Backend
-
-        else:
-
-            class orig_class(matplotlib.backend_bases._Backend):
-                locals().update(vars(mod))
-
-                @classmethod
-                def mainloop(cls):
-                    return mod.Show().mainloop()
-
-        class BackendClass(orig_class):
-            @classmethod
-            def show_managers(cls, *, managers, block):
-                if not managers:
-                    return
-                for manager in managers:
-                    manager.show()  # Emits a warning for non-interactive backend
-                    manager.canvas.draw_idle()
-                if cls.mainloop is None:
-                    return
-                if block:
-                    try:
-                        cls.FigureManager._active_managers = managers
-                        cls.mainloop()
-                    finally:
-                        cls.FigureManager._active_managers = None
-
-        if not hasattr(BackendClass.FigureManager, "_active_managers"):
-            BackendClass.FigureManager._active_managers = None
-        rc_params_string = newbackend
+        key = newbackend.lower()
+        if key not in _backend_cache:
+            _backend_cache[key] = _build_backend_class(newbackend)
+        BackendClass, rc_params_string = _backend_cache[key]
 
     else:
         BackendClass = newbackend
@@ -169,7 +392,9 @@ def select_gui_toolkit(newbackend=None):
             # macosx -> osx mapping for the osx backend in ipython
             if required_framework == "macosx":
                 required_framework = "osx"
-            ip.enable_gui(required_framework)
+            if _ipython_gui != (ip, required_framework):
+                ip.enable_gui(required_framework)
+                _ipython_gui = (ip, required_framework)
 
     # remember to set the global variable
     _backend_mod = BackendClass
@@ -0,0 +1,240 @@
+"""A pool of hidden figure managers that can be re-used by new Figures."""
+
+import math
+import time
+
+from ._figure import Figure
+from ._manage_backend import current_backend_module
+
+
+_pool = None
+
+# (owner, attribute) pairs of the callback ids that managers and toolbars
+# connect on the canvas when they are created.  The callbacks are stored on
+# the Figure, so they have to move with the canvas when a Figure is swapped.
+_HANDLER_IDS = [
+    ("manager", "key_press_handler_id"),
+    ("manager", "button_press_handler_id"),
+    ("manager", "scroll_handler_id"),
+    ("toolbar", "_id_press"),
+    ("toolbar", "_id_release"),
+    ("toolbar", "_id_drag"),
+]
+
+
+def _hide(manager):
+    """Hide the window of *manager*, return False if we do not know how."""
+    hide = getattr(manager, "hide", None)
+    if hide is None:
+        window = getattr(manager, "window", None)
+        for name in ("withdraw", "hide", "Hide"):
+            hide = getattr(window, name, None)
+            if hide is not None:
+                break
+        else:
+            return False
+    hide()
+    if hasattr(manager, "_shown"):
+        manager._shown = False
+    return True
+
+
+def _move_handlers(manager, src, dst):
+    """Move the manager's and toolbar's canvas callbacks from *src* to *dst*."""
+    owners = {"manager": manager, "toolbar": manager.canvas.toolbar}
+    for owner_name, attr in _HANDLER_IDS:
+        owner = owners[owner_name]
+        cid = getattr(owner, attr, None)
+        if cid is None:
+            continue
+        for signal, refs in src._canvas_callbacks.callbacks.items():
+            if cid in refs:
+                func = refs[cid]()
+                src._canvas_callbacks.disconnect(cid)
+                setattr(owner, attr, dst._canvas_callbacks.connect(signal, func))
+                break
+
+
+def _swap_figure(manager, fig):
+    """Put *fig* on the canvas of *manager* and return the Figure it had."""
+    canvas = manager.canvas
+    old = canvas.figure
+    _move_handlers(manager, old, fig)
+    fig._original_dpi = getattr(fig, "_original_dpi", fig.dpi)
+    fig.set_canvas(canvas)
+    canvas.figure = fig
+    ratio = canvas.device_pixel_ratio
+    if ratio != 1:
+        fig._set_dpi(ratio * fig._original_dpi, forward=False)
+    canvas.mouse_grabber = None
+    canvas._blit_backgrounds = {}
+    return old
+
+
+class ManagerPool:
+    """
+    Hidden figure managers (and their native windows) waiting for a Figure.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum number of hidden managers kept.  Managers handed back
+        to a full pool are destroyed.
+
+    idle_timeout : float
+        Seconds after which a hidden manager is destroyed.  Expired managers
+        are evicted by a timer on the canvas of a hidden manager (if the
+        backend's timers run), when the pool is used or when `evict_idle`
+        is called.
+    """
+
+    def __init__(self, max_size, *, idle_timeout):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        # list of (manager, time it was hidden), oldest first
+        self._idle = []
+        # single-shot timer for the next expiry, on the oldest one's canvas
+        self._timer = None
+
+    def __len__(self):
+        return len(self._idle)
+
+    def fill(self, backend_mod, n):
+        """Pre-create up to *n* hidden managers for *backend_mod*."""
+        now = time.monotonic()
+        for _ in range(min(n, self.max_size - len(self._idle))):
+            manager = backend_mod.new_figure_manager_given_figure(-1, Figure())
+            self._idle.append((manager, now))
+        self._schedule_eviction()
+
+    def acquire(self, backend_mod, fig, num):
+        """
+        Return a hidden manager showing *fig*, or None if there is none.
+        """
+        self.evict_idle()
+        for j in range(len(self._idle) - 1, -1, -1):
+            manager, _ = self._idle[j]
+            if isinstance(manager, backend_mod.FigureManager):
+                del self._idle[j]
+                break
+        else:
+            return None
+        # the timer may have been on its canvas
+        self._schedule_eviction()
+        _swap_figure(manager, fig)
+        manager.num = num
+        manager.set_window_title(fig.get_label() or f"Figure {num:d}")
+        width, height = fig.bbox.size
+        if manager.canvas.get_width_height(physical=True) != (int(width), int(height)):
+            manager.resize(width, height)
+        if manager.canvas.toolbar is not None:
+            manager.canvas.toolbar.update()
+        return manager
+
+    def release(self, manager):
+        """
+        Hide *manager* and keep it for re-use.
+
+        The Figure is taken off of the canvas (the caller is responsible
+        for giving it a new one).  Returns False, without touching the
+        manager, if it can not be pooled.
+        """
+        self.evict_idle()
+        if (
+            len(self._idle) >= self.max_size
+            or not getattr(manager, "_poolable", True)
+            or not _hide(manager)
+        ):
+            return False
+        _swap_figure(manager, Figure())
+        self._idle.append((manager, time.monotonic()))
+        self._schedule_eviction()
+        return True
+
+    def evict_idle(self):
+        """Destroy the managers that have been hidden longer than the timeout."""
+        # stop the timer while its canvas is still alive
+        self._stop_timer()
+        cutoff = time.monotonic() - self.idle_timeout
+        while self._idle and self._idle[0][1] <= cutoff:
+            manager, _ = self._idle.pop(0)
+            manager.destroy()
+        self._schedule_eviction()
+
+    def clear(self):
+        """Destroy all of the hidden managers."""
+        self._stop_timer()
+        while self._idle:
+            manager, _ = self._idle.pop()
+            manager.destroy()
+
+    def _stop_timer(self):
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+    def _schedule_eviction(self):
+        # so hidden windows are freed even if the pool is not used again
+        self._stop_timer()
+        if not self._idle:
+            return
+        manager, hidden = self._idle[0]
+        wait = hidden + self.idle_timeout - time.monotonic()
+        if not math.isfinite(wait):
+            return
+        self._timer = manager.canvas.new_timer(
+            interval=math.ceil(max(0, wait) * 1000)
+        )
+        self._timer.single_shot = True
+        self._timer.add_callback(self.evict_idle)
+        self._timer.start()
+
+
+def current_manager_pool():
+    """Return the active `ManagerPool` or None if pooling is disabled."""
+    return _pool
+
+
+def enable_manager_pool(max_size=4, *, idle_timeout=60, prefill=0):
+    """
+    Re-use the native windows of closed Figures for newly promoted Figures.
+
+    When enabled, `.FigureRegistry.close` and `.demote_figure` hide the
+    window instead of destroying it and the next promoted Figure is put
+    into a hidden window, if there is one, rather than a new one.
+
+    Parameters
+    ----------
+    max_size : int, default: 4
+        The maximum number of hidden windows to keep around.
+
+    idle_timeout : float, default: 60
+        Seconds after which an unused hidden window is destroyed.
+
+    prefill : int, default: 0
+        The number of hidden windows to create up front with the current
+        backend.
+
+    Returns
+    -------
+    ManagerPool
+    """
+    global _pool
+    disable_manager_pool()
+    _pool = ManagerPool(max_size, idle_timeout=idle_timeout)
+    if prefill:
+        _pool.fill(current_backend_module(), prefill)
+    return _pool
+
+
+def disable_manager_pool():
+    """Stop re-using windows and destroy any hidden windows."""
+    global _pool
+    if _pool is not None:
+        _pool.clear()
+    _pool = None
+
+
+def release_manager(manager):
+    """Hand *manager* to the pool, return False if it must be destroyed."""
+    return _pool is not None and _pool.release(manager)
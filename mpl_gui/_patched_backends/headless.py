@@ -0,0 +1,175 @@
+"""
+A backend with no GUI that records what it is asked to do.
+
+Select it with ``mpl_gui.select_gui_toolkit("headless")``.  Showing,
+drawing and destroying do no real work, they only count the calls and the
+time spent in them in `calls`, which makes it cheap enough to run registry
+workflows with many thousands of Figures without a display server.  Drawing
+still emits the ``draw_event``, so whatever listens to it runs as it would
+with a real backend.
+"""
+
+from collections import Counter, defaultdict
+import time
+
+from matplotlib.backend_bases import (
+    _Backend,
+    DrawEvent,
+    FigureCanvasBase,
+    FigureManagerBase,
+    TimerBase,
+)
+
+from .._tab_host import TabbedWindowBase, TabCanvasMixin, TabManagerMixin
+
+
+class CallLog:
+    """Count of, and total seconds spent in, each kind of call."""
+
+    def __init__(self):
+        self.counts = Counter()
+        self.seconds = defaultdict(float)
+
+    def record(self, name, start):
+        self.counts[name] += 1
+        self.seconds[name] += time.perf_counter() - start
+
+    def reset(self):
+        self.counts.clear()
+        self.seconds.clear()
+
+
+calls = CallLog()
+
+
+class TimerHeadless(TimerBase):
+    """Timer that fires from `FigureCanvasHeadless.flush_events`."""
+
+    _pending = {}
+
+    def _timer_start(self):
+        self._pending[self] = time.monotonic() + self._interval / 1000
+
+    def _timer_stop(self):
+        self._pending.pop(self, None)
+
+    @classmethod
+    def _run_due(cls):
+        now = time.monotonic()
+        for timer, due in list(cls._pending.items()):
+            if due <= now:
+                if timer._single:
+                    timer.stop()
+                else:
+                    timer._timer_start()
+                timer._on_timer()
+
+
+class FigureCanvasHeadless(FigureCanvasBase):
+    required_interactive_framework = None
+    _timer_cls = TimerHeadless
+
+    def draw(self):
+        start = time.perf_counter()
+        # nothing is rendered, but the Figure is up to date as far as anyone
+        # can tell
+        self.figure.stale = False
+        DrawEvent("draw_event", self, None)._process()
+        calls.record("draw", start)
+
+    def draw_idle(self, *args, **kwargs):
+        # there is no event loop to defer to, so just draw
+        start = time.perf_counter()
+        if not self._is_idle_drawing:
+            with self._idle_draw_cntx():
+                self.draw()
+        calls.record("draw_idle", start)
+
+    def flush_events(self):
+        start = time.perf_counter()
+        TimerHeadless._run_due()
+        calls.record("flush_events", start)
+
+    def start_event_loop(self, timeout=0):
+        start = time.perf_counter()
+        self.flush_events()
+        calls.record("start_event_loop", start)
+
+
+class FigureManagerHeadless(FigureManagerBase):
+    _active_managers = None
+
+    def __init__(self, canvas, num):
+        super().__init__(canvas, num)
+        self._shown = False
+
+    def show(self):
+        start = time.perf_counter()
+        self._shown = True
+        calls.record("show", start)
+
+    def hide(self):
+        start = time.perf_counter()
+        self._shown = False
+        calls.record("hide", start)
+
+    def destroy(self):
+        start = time.perf_counter()
+        self._shown = False
+        calls.record("destroy", start)
+
+
+FigureCanvasHeadless.manager_class = FigureManagerHeadless
+
+
+class FigureCanvasHeadlessTab(TabCanvasMixin, FigureCanvasHeadless):
+    pass
+
+
+class FigureManagerHeadlessTab(TabManagerMixin, FigureManagerHeadless):
+    def __init__(self, canvas, num, tab_window):
+        self.tab_window = tab_window
+        super().__init__(canvas, num)
+
+
+class TabbedWindowHeadless(TabbedWindowBase):
+    """A window with tabs that records its calls like the rest of the backend."""
+
+    def _new_manager(self, fig, num):
+        start = time.perf_counter()
+        manager = FigureManagerHeadlessTab(FigureCanvasHeadlessTab(fig), num, self)
+        calls.record("new_tab", start)
+        return manager
+
+    def _select_tab(self, manager):
+        start = time.perf_counter()
+        calls.record("select_tab", start)
+
+    def _remove_tab(self, manager):
+        start = time.perf_counter()
+        manager._shown = False
+        calls.record("remove_tab", start)
+
+    def _show_window(self):
+        start = time.perf_counter()
+        calls.record("show_window", start)
+
+    def _destroy_window(self):
+        start = time.perf_counter()
+        calls.record("destroy_window", start)
+
+
+@_Backend.export
+class _BackendHeadless(_Backend):
+    backend_version = "0"
+    FigureCanvas = FigureCanvasHeadless
+    FigureManager = FigureManagerHeadless
+    TabbedWindow = TabbedWindowHeadless
+
+    @classmethod
+    def mainloop(cls):
+        start = time.perf_counter()
+        calls.record("mainloop", start)
+
+
+Backend = _BackendHeadless
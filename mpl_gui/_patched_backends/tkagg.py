@@ -1,12 +1,20 @@
 from contextlib import contextmanager
+import tkinter as tk
+from tkinter import ttk
 
 import matplotlib as mpl
-from matplotlib import _c_internal_utils
+from matplotlib import _c_internal_utils, cbook
+from matplotlib.backend_bases import FigureManagerBase
+from matplotlib.backends import _tkagg
 from matplotlib.backends.backend_tkagg import (
     _BackendTkAgg,
+    FigureCanvasTkAgg,
     FigureManagerTk as _FigureManagerTk,
 )
 
+from .._render_cache import refresh_canvas
+from .._tab_host import TabbedWindowBase, TabCanvasMixin, TabManagerMixin
+
 
 @contextmanager
 def _restore_foreground_window_at_end():
@@ -28,7 +36,7 @@ class FigureManagerTk(_FigureManagerTk):
                 self.window.deiconify()
                 self.canvas._tkcanvas.focus_set()
             else:
-                self.canvas.draw_idle()
+                refresh_canvas(self.canvas)
             if mpl.rcParams["figure.raise_window"]:
                 self.canvas.manager.window.attributes("-topmost", 1)
                 self.canvas.manager.window.attributes("-topmost", 0)
@@ -55,6 +63,117 @@ class FigureManagerTk(_FigureManagerTk):
         self.window.after_idle(self.window.after, 0, delayed_destroy)
 
 
+class FigureCanvasTkAggTab(TabCanvasMixin, FigureCanvasTkAgg):
+    pass
+
+
+class FigureManagerTkTab(TabManagerMixin, FigureManagerTk):
+    """The manager of a Figure in a tab of a `TabbedWindowTk`."""
+
+    def __init__(self, canvas, num, tab_window, frame):
+        self.tab_window = tab_window
+        self.window = tab_window.window
+        self.frame = frame
+        # the set up FigureManagerTk does is for a window of our own
+        FigureManagerBase.__init__(self, canvas, num)
+        self.canvas._tkcanvas.pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+        # the DPI of the shared window is tracked by the tabbed window, each
+        # tab rescales its own canvas and toolbar when it changes
+        self._window_dpi = tab_window.window_dpi
+        self._window_dpi_cbname = ""
+        if tab_window.dpi_aware:
+            self._window_dpi_cbname = self._window_dpi.trace_add(
+                "write", self._update_window_dpi
+            )
+        self._shown = False
+
+    def destroy(self, *args):
+        if self._window_dpi_cbname:
+            self._window_dpi.trace_remove("write", self._window_dpi_cbname)
+            self._window_dpi_cbname = ""
+        if self.canvas._idle_draw_id:
+            self.canvas._tkcanvas.after_cancel(self.canvas._idle_draw_id)
+        if self.canvas._event_loop_id:
+            self.canvas._tkcanvas.after_cancel(self.canvas._event_loop_id)
+        super().destroy()
+
+
+class TabbedWindowTk(TabbedWindowBase):
+    """A Tk window with a `ttk.Notebook` holding a Figure in each tab."""
+
+    def __init__(self):
+        super().__init__()
+        with _restore_foreground_window_at_end():
+            if cbook._get_running_interactive_framework() is None:
+                cbook._setup_new_guiapp()
+                _c_internal_utils.Win32_SetProcessDpiAwareness_max()
+            self.window = tk.Tk(className="matplotlib")
+            self.window.withdraw()
+        self.window.wm_title("Figures")
+        self.window.protocol("WM_DELETE_WINDOW", self.destroy)
+        # as FigureManagerTk does for its window: if the window has
+        # per-monitor DPI awareness the C code keeps this variable up to date
+        window_frame = int(self.window.wm_frame(), 16)
+        self.window_dpi = tk.IntVar(
+            master=self.window, value=96, name=f"window_dpi{window_frame}"
+        )
+        self.dpi_aware = _tkagg.enable_dpi_awareness(
+            window_frame, self.window.tk.interpaddr()
+        )
+        self.notebook = ttk.Notebook(self.window)
+        self.notebook.pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+        # a tab selected by the user
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event):
+        selected = self.notebook.select()
+        for manager in self.managers:
+            if str(manager.frame) == selected:
+                self._on_selected(manager)
+                break
+
+    def _new_manager(self, fig, num):
+        # Tk only maps (and so lays out and draws) the widgets of the selected
+        # tab, the other canvases do not render until their tab is selected
+        frame = tk.Frame(self.notebook)
+        self.notebook.add(frame)
+        canvas = FigureCanvasTkAggTab(fig, master=frame)
+        return FigureManagerTkTab(canvas, num, self, frame)
+
+    def _set_tab_title(self, manager, title):
+        self.notebook.tab(manager.frame, text=title)
+
+    def _select_tab(self, manager):
+        self.notebook.select(manager.frame)
+
+    def _remove_tab(self, manager):
+        # destroying the canvas widget emits the close_event of the Figure
+        self.notebook.forget(manager.frame)
+        manager.frame.destroy()
+
+    def _show_window(self):
+        with _restore_foreground_window_at_end():
+            self.window.deiconify()
+            if mpl.rcParams["figure.raise_window"]:
+                self.window.attributes("-topmost", 1)
+                self.window.attributes("-topmost", 0)
+
+    def _destroy_window(self):
+        window = self.window
+
+        def delayed_destroy():
+            window.destroy()
+            # as FigureManagerTk.destroy, which the tabs share the flags with
+            if (
+                FigureManagerTkTab._owns_mainloop
+                and not FigureManagerTkTab._active_managers
+            ):
+                window.quit()
+
+        # "after idle after 0" avoids Tcl error/race (GH #19940)
+        window.after_idle(window.after, 0, delayed_destroy)
+
+
 @_BackendTkAgg.export
 class _PatchedBackendTkAgg(_BackendTkAgg):
     @classmethod
@@ -72,6 +191,7 @@ class _PatchedBackendTkAgg(_BackendTkAgg):
                 manager_class._owns_mainloop = False
 
     FigureManager = FigureManagerTk
+    TabbedWindow = TabbedWindowTk
 
 
 Backend = _PatchedBackendTkAgg
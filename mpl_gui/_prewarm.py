@@ -0,0 +1,69 @@
+"""Do the thread-safe parts of starting a GUI ahead of time."""
+
+import importlib
+import logging
+import threading
+import time
+
+
+_log = logging.getLogger(__name__)
+
+
+def prewarm(backend=None):
+    """
+    Start importing the GUI toolkit and loading fonts on a background thread.
+
+    The first `.display` in a process imports the toolkit and Matplotlib's
+    rendering machinery and loads the font cache.  Calling this right after
+    importing mpl_gui does the parts of that which are safe off of the main
+    thread (importing modules, loading the font manager and probing for an
+    available toolkit) while the program gets on with other work.  Nothing
+    that touches the GUI, such as creating the application object, is done.
+
+    Parameters
+    ----------
+    backend : str, optional
+        The backend that will be used.  Defaults to :rc:`backend`, and if
+        that is not set to the backend the auto-selection would try first.
+
+    Returns
+    -------
+    threading.Thread
+        The (daemon) thread doing the work, join it to wait for it to finish.
+    """
+    thread = threading.Thread(
+        target=_prewarm, args=(backend,), name="mpl_gui-prewarm", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def _prewarm(backend):
+    start = time.perf_counter()
+    try:
+        # the registry pulls in the rest of mpl_gui and Matplotlib's Figure
+        from . import _registry  # noqa: F401
+        from ._manage_backend import (
+            _auto_candidates,
+            _backend_module_name,
+            _probe,
+        )
+        from matplotlib import rcParams, rcsetup
+        import matplotlib.backends.backend_agg  # noqa: F401
+
+        # importing the font manager loads (or builds) the font cache
+        import matplotlib.font_manager  # noqa: F401
+
+        if backend is None:
+            backend = dict.__getitem__(rcParams, "backend")
+        if backend is rcsetup._auto_backend_sentinel:
+            candidates, *_ = _auto_candidates()
+            backend = next((c for c in candidates if _probe(c) is None), "agg")
+        importlib.import_module(_backend_module_name(backend))
+    except Exception as e:
+        # this is only an optimization, the real import will report errors
+        _log.debug("Pre-warming failed: %s", e)
+    else:
+        _log.debug(
+            "Pre-warmed %s in %.2f ms", backend, (time.perf_counter() - start) * 1000
+        )
@@ -8,10 +8,18 @@ from matplotlib import is_interactive
 from matplotlib.cbook import _api
 from matplotlib.backend_bases import FigureCanvasBase
 from ._manage_backend import current_backend_module
+from ._draw_scheduler import current_draw_scheduler
+from ._manager_pool import current_manager_pool, release_manager
+from ._render_cache import refresh_canvas
+from ._tab_host import current_tab_host
 
 
 _figure_count = itertools.count()
 
+# callables taking (fig, promoted), called when a Figure gains or loses its
+# GUI manager
+_promotion_listeners = []
+
 
 def _auto_draw_if_interactive(fig, val):
     """
@@ -33,61 +41,124 @@ def _auto_draw_if_interactive(fig, val):
         # (e.g. axes position & tick labels being computed at draw time), but
         # this shouldn't trigger a redraw because the current redraw will
         # already take them into account.
+        scheduler = current_draw_scheduler()
+        if scheduler is not None and scheduler.request(fig):
+            return
         with fig.canvas._idle_draw_cntx():
             fig.canvas.draw_idle()
 
 
-def promote_figure(fig, *, auto_draw=True, num):
-    """Create a new figure manager instance."""
-    _backend_mod = current_backend_module()
+def _check_thread(backend_mod):
     if (
-        getattr(_backend_mod.FigureCanvas, "required_interactive_framework", None)
+        getattr(backend_mod.FigureCanvas, "required_interactive_framework", None)
         and threading.current_thread() is not threading.main_thread()
     ):
         _api.warn_external(
             "Starting a Matplotlib GUI outside of the main thread will likely fail."
         )
 
+
+# HACK: the callback in backend_bases uses GCF.destroy which misses these
+# figures by design!  This is shared by all of the promoted figures.
+def _destroy_on_hotkey(event):
+    if event.key in mpl.rcParams["keymap.quit"]:
+        # grab the manager off the event
+        mgr = event.canvas.manager
+        if mgr is None:
+            raise RuntimeError("Should never be here, please report a bug.")
+        # close the window
+        mgr.destroy()
+
+
+def _new_manager(backend_mod, fig, *, auto_draw, num):
+    """Create (but do not show) the manager for a Figure."""
     if fig.canvas.manager is not None:
-        if not isinstance(fig.canvas.manager, _backend_mod.FigureManager):
+        if not isinstance(fig.canvas.manager, backend_mod.FigureManager):
             raise Exception("Figure already has a manager an it is the wrong type!")
         else:
             # TODO is this the right behavior?
-            return fig.canvas.manager
+            return fig.canvas.manager, False
     # TODO: do we want to make sure we poison / destroy / decouple the existing
     # canavs?
     next_num = next(_figure_count)
-    manager = _backend_mod.new_figure_manager_given_figure(
-        num if num is not None else next_num, fig
-    )
+    if num is None:
+        num = next_num
+    host = current_tab_host()
+    manager = host.acquire(backend_mod, fig, num) if host is not None else None
+    pool = current_manager_pool()
+    if manager is None and pool is not None:
+        manager = pool.acquire(backend_mod, fig, num)
+    if manager is None:
+        manager = backend_mod.new_figure_manager_given_figure(num, fig)
     if fig.get_label():
         manager.set_window_title(fig.get_label())
 
     if auto_draw:
         fig.stale_callback = _auto_draw_if_interactive
 
-    if is_interactive():
-        manager.show()
-        fig.canvas.draw_idle()
-
-    # HACK: the callback in backend_bases uses GCF.destroy which misses these
-    # figures by design!
-    def _destroy_on_hotkey(event):
-        if event.key in mpl.rcParams["keymap.quit"]:
-            # grab the manager off the event
-            mgr = event.canvas.manager
-            if mgr is None:
-                raise RuntimeError("Should never be here, please report a bug.")
-            # close the window
-            mgr.destroy()
-
     # remove this callback.  Callbacks live on the Figure so survive the canvas
     # being replaced.
     fig._destroy_cid = fig.canvas.mpl_connect("key_press_event", _destroy_on_hotkey)
 
+    return manager, True
+
+
+def promote_figure(fig, *, auto_draw=True, num):
+    """Create a new figure manager instance."""
+    (manager,) = promote_figures([fig], auto_draw=auto_draw, nums=[num])
     return manager
 
 
+def promote_figures(figs, *, auto_draw=True, nums=None):
+    """
+    Create new figure manager instances for many Figures at once.
+
+    All of the managers are created before any of them are shown so that,
+    in interactive mode, the windows are shown and drawn in a single pass.
+
+    Parameters
+    ----------
+    figs : list[Figure]
+        The Figures to promote.
+
+    auto_draw : bool, default: True
+        Whether to redraw the Figures when they become stale.
+
+    nums : list[int or None], optional
+        The number to give the manager of each Figure.  If not given, or if
+        None, the next number from a global counter is used.
+
+    Returns
+    -------
+    list[FigureManager]
+        The manager of each Figure, in order.
+    """
+    _backend_mod = current_backend_module()
+    _check_thread(_backend_mod)
+    if nums is None:
+        nums = [None] * len(figs)
+
+    managers = []
+    new = []
+    for fig, num in zip(figs, nums):
+        manager, created = _new_manager(
+            _backend_mod, fig, auto_draw=auto_draw, num=num
+        )
+        managers.append(manager)
+        if created:
+            new.append(manager)
+            for listener in _promotion_listeners:
+                listener(fig, True)
+
+    if is_interactive():
+        for manager in new:
+            manager.show()
+        for manager in new:
+            refresh_canvas(manager.canvas)
+
+    return managers
+
+
 def demote_figure(fig):
     """Fully clear all GUI elements from the `~matplotlib.figure.Figure`.
 
@@ -98,12 +169,22 @@ def demote_figure(fig):
     fig : matplotlib.figure.Figure
 
     """
-    fig.canvas.destroy()
-    fig.canvas.manager = None
     original_dpi = getattr(fig, "_original_dpi", fig.dpi)
     if (cid := getattr(fig, '_destroy_cid', None)) is not None:
         fig.canvas.mpl_disconnect(cid)
+    canvas = fig.canvas
+    manager = canvas.manager
+    if (scheduler := current_draw_scheduler()) is not None:
+        # while the canvas is still alive to stop a timer running on it
+        scheduler.discard(fig)
+    # move the Figure to its new canvas first, so a close_event emitted while
+    # destroying the window can be told apart from the user closing it
     FigureCanvasBase(fig)
+    if manager is not None and not release_manager(manager):
+        manager.destroy()
+        canvas.figure = None
     fig.dpi = original_dpi
+    for listener in _promotion_listeners:
+        listener(fig, False)
 
     return fig
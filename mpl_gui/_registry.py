@@ -0,0 +1,995 @@
+"""The Figure registries and the functions to display Figures."""
+import asyncio
+from collections.abc import Mapping
+import functools
+import logging
+from pathlib import Path
+import time
+import warnings
+import weakref
+
+from matplotlib import _api
+from matplotlib.backend_bases import FigureCanvasBase as _FigureCanvasBase
+
+from ._manage_interactive import is_interactive
+from ._manage_backend import current_backend_module as _cbm, show_and_refresh
+from ._promotion import (
+    demote_figure as _demote_figure,
+    promote_figures as _promote_figures,
+    _promotion_listeners,
+)
+from ._manager_pool import release_manager as _release_manager
+from ._draw_scheduler import current_draw_scheduler as _current_draw_scheduler
+from ._export import export_figures as _export_figures, _safe_name
+from ._release import release_figure as _release_figure
+from ._creation import figure, subplots, subplot_mosaic
+
+
+_log = logging.getLogger(__name__)
+
+
+def display(*figs, block=None, timeout=0):
+    """
+    Show the figures and maybe block.
+
+    Parameters
+    ----------
+    *figs : Figure
+        The figures to show.  If they do not currently have a GUI aware
+        canvas + manager attached they will be promoted.
+
+    block : bool, optional
+        Whether to wait for all figures to be closed before returning.
+
+        If `True` block and run the GUI main loop until all figure windows
+        are closed.
+
+        If `False` ensure that all figure windows are displayed and return
+        immediately.  In this case, you are responsible for ensuring
+        that the event loop is running to have responsive figures.
+
+        Defaults to True in non-interactive mode and to False in interactive
+        mode (see `.is_interactive`).
+
+    timeout : float, optional
+        How long to run the event loop in msec if blocking.
+
+    """
+    # TODO handle single figure
+
+    # call this to ensure a backend is indeed selected
+    backend = _cbm()
+    _promote_figures([fig for fig in figs if fig.canvas.manager is None])
+    managers = [fig.canvas.manager for fig in figs]
+
+    if block is None:
+        block = not is_interactive()
+
+    if block and len(managers):
+        if timeout == 0:
+            backend.show_managers(managers=managers, block=block)
+        elif len(managers):
+            manager, *_ = managers
+            manager.canvas.start_event_loop(timeout=timeout)
+
+
+async def display_async(*figs, timeout=0, interval=0.01):
+    """
+    Show the figures and wait for them to be closed without blocking asyncio.
+
+    Rather than handing control to the GUI main loop, the pending GUI events
+    are processed (via ``canvas.flush_events``) once per *interval* from a
+    coroutine, so the asyncio event loop keeps running in between.
+
+    Parameters
+    ----------
+    *figs : Figure
+        The figures to show.  If they do not currently have a GUI aware
+        canvas + manager attached they will be promoted.
+
+    timeout : float, optional
+        How long, in seconds, to process GUI events for.  If 0, return once
+        all of the figure windows are closed.
+
+    interval : float, optional
+        Seconds to yield to the asyncio event loop between processing the
+        pending GUI events.
+
+    """
+    backend = _cbm()
+    _promote_figures([fig for fig in figs if fig.canvas.manager is None])
+    managers = [fig.canvas.manager for fig in figs]
+    if not managers:
+        return
+    show_and_refresh(managers)
+    if backend.mainloop is None:
+        return
+
+    closed = set()
+    cids = {
+        fig: fig.canvas.mpl_connect("close_event", lambda e, fig=fig: closed.add(fig))
+        for fig in figs
+    }
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout if timeout else None
+    try:
+        while deadline is None or loop.time() < deadline:
+            live = [
+                fig
+                for fig in figs
+                if fig not in closed and fig.canvas.manager is not None
+            ]
+            if not live:
+                break
+            # one call processes the events of every window of the toolkit
+            live[0].canvas.flush_events()
+            await asyncio.sleep(interval)
+    finally:
+        for fig, cid in cids.items():
+            fig.canvas.mpl_disconnect(cid)
+
+
+class _FigureRecord:
+    """What a FigureRegistry knows about one of its Figures."""
+
+    __slots__ = (
+        "number",
+        "label",
+        "label_cid",
+        "promoted",
+        "created",
+        "draw_count",
+        "last_draw",
+        "finalizer",
+    )
+
+    def __init__(self, number, label, label_cid, promoted):
+        self.number = number
+        self.label = label
+        self.label_cid = label_cid
+        self.promoted = promoted
+        self.created = time.time()
+        self.draw_count = 0
+        self.last_draw = None
+        # only used by registries with retain="weak"
+        self.finalizer = None
+
+    def _asdict(self):
+        return {
+            k: getattr(self, k)
+            for k in self.__slots__
+            if k not in ("label_cid", "finalizer")
+        }
+
+
+class _FigureMapping(Mapping):
+    """
+    A snapshot of some of the Figures of a Registry, by number or label.
+
+    Lazy Figures are only built when they are looked up, so listing the
+    keys does not build them.
+    """
+
+    def __init__(self, registry, nums, figs):
+        self._registry = registry
+        # key -> number, in order
+        self._nums = nums
+        # number -> Figure, of the Figures already built
+        self._figs = figs
+
+    def __getitem__(self, key):
+        num = self._nums[key]
+        fig = self._figs.get(num)
+        if fig is None:
+            fig = self._figs[num] = self._registry._get_by_number(num)
+        return fig
+
+    def __iter__(self):
+        return iter(self._nums)
+
+    def __len__(self):
+        return len(self._nums)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+# every live FigureRegistry, for the shared callbacks to find a figure's owners
+_registries = weakref.WeakSet()
+
+
+def _dispatch_close_event(event):
+    fig = event.canvas.figure
+    if fig is None or fig.canvas is not event.canvas:
+        # the window of a Figure that has been demoted being destroyed
+        return
+    for registry in list(_registries):
+        if fig in registry._records:
+            # the user closed the window, which is going away, so it can not
+            # be handed to the manager pool
+            registry._close_fig(fig, pool=False)
+
+
+def _dispatch_fig_changed(fig):
+    for registry in _registries:
+        if fig in registry._records:
+            registry._on_fig_changed(fig)
+
+
+def _dispatch_draw_event(event):
+    fig = event.canvas.figure
+    now = time.time()
+    for registry in _registries:
+        if (record := registry._records.get(fig)) is not None:
+            record.draw_count += 1
+            record.last_draw = now
+
+
+def _dispatch_interaction(event):
+    fig = event.canvas.figure
+    for registry in _registries:
+        if fig in registry._live:
+            registry._touch(fig)
+
+
+# the events that count as using a window for max_live_windows
+_interaction_events = (
+    "button_press_event",
+    "key_press_event",
+    "scroll_event",
+    "figure_enter_event",
+)
+
+
+def _dispatch_promotion(fig, promoted):
+    for registry in _registries:
+        if fig in registry._records:
+            registry._on_promotion(fig, promoted)
+
+
+def _forget_collected(registry_ref, record):
+    # weakref.finalize callback, so must not hold the registry alive
+    registry = registry_ref()
+    if registry is not None:
+        registry._forget(record)
+
+
+_promotion_listeners.append(_dispatch_promotion)
+
+
+class FigureRegistry:
+    """
+    A registry to wrap the creation of figures and track them.
+
+    By default this instance will keep a hard reference to created Figures
+    to ensure that they do not get garbage collected (see *retain*).
+
+    Parameters
+    ----------
+    block : bool, optional
+        Whether to wait for all figures to be closed before returning from
+        show_all.
+
+        If `True` block and run the GUI main loop until all figure windows
+        are closed.
+
+        If `False` ensure that all figure windows are displayed and return
+        immediately.  In this case, you are responsible for ensuring
+        that the event loop is running to have responsive figures.
+
+        Defaults to True in non-interactive mode and to False in interactive
+        mode (see `.is_interactive`).
+
+    timeout : float, optional
+        Default time to wait for all of the Figures to be closed if blocking.
+
+        If 0 block forever.
+
+    retain : {"strong", "weak"}, default: "strong"
+        How the Registry holds on to its Figures.
+
+        With "strong" every Figure is kept alive until it is closed.
+
+        With "weak" only the Figures with a GUI window are kept alive.  The
+        rest are forgotten (and their numbers and labels freed) as soon as
+        nothing else references them and they are garbage collected, so a
+        long running session does not accumulate Figures that were never
+        closed.
+
+    max_live_windows : int, optional
+        The most Figures that may have a GUI window at once.
+
+        Beyond that, the least recently used window (the one least recently
+        promoted, shown or clicked, typed or scrolled in or entered with the
+        mouse) is demoted with `.demote_figure` to free its native window and
+        buffers.  The Figure stays in the Registry, with its number and
+        label, and gets a new window (with the same title) when it is shown
+        again with `.FigureRegistry.show_figure`.  With ``retain="weak"`` the
+        Registry keeps the Figures it demoted alive until then.
+        `.FigureRegistry.show_all` only shows the newest Figures that fit.
+
+        Defaults to no limit.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        block=None,
+        timeout=0,
+        prefix="Figure ",
+        retain="strong",
+        max_live_windows=None,
+    ):
+        _api.check_in_list(["strong", "weak"], retain=retain)
+        if max_live_windows is not None and max_live_windows < 1:
+            raise ValueError(
+                f"max_live_windows must be at least 1, not {max_live_windows!r}"
+            )
+        # settings stashed to set defaults on show
+        self._timeout = timeout
+        self._block = block
+        self._weak = retain == "weak"
+        self._max_live_windows = max_live_windows
+        # the canonical location for storing the Figures this registry owns,
+        # mapped to a _FigureRecord.  any additional views must never include
+        # a figure that is not a key but may omit figures
+        self._records = weakref.WeakKeyDictionary() if self._weak else dict()
+        # reverse index of the record numbers so number lookups do not scan
+        self._number_to_fig = (
+            weakref.WeakValueDictionary() if self._weak else dict()
+        )
+        # the promoted Figures, least recently used first.  This also keeps
+        # them alive as long as they have a window with retain="weak"
+        self._live = dict()
+        # the Figures demoted to stay within max_live_windows, kept alive
+        # (with retain="weak") until they are shown again or closed
+        self._parked = dict()
+        # one more than the largest number in use, stepped back down on close
+        # so that numbers are assigned as ``max(numbers) + 1`` in O(1)
+        self._next_num = 0
+        # label index, kept current via each Figure's "pchanged" callback.
+        # maps label -> {number: None} to keep duplicates in order (numbers
+        # rather than Figures so that it never keeps a Figure alive)
+        self._label_to_nums = dict()
+        # the Figures registered with lazy_figure that have not been built
+        # yet, number -> (builder, _FigureRecord).  They share the number and
+        # label indexes with the Figures in _records
+        self._lazy = dict()
+        # Settings / state to control the default figure label
+        self._prefix = prefix
+        _registries.add(self)
+
+    @property
+    def figures(self):
+        """All of the Figures in number order, building any lazy Figures."""
+        return tuple(self.by_number.values())
+
+    def _register_fig(self, fig):
+        (fig,) = self._register_figs([fig])
+        return fig
+
+    def _register_figs(self, figs, nums=None):
+        for fig, num in zip(figs, nums or [None] * len(figs)):
+            self._register_one(fig, num)
+        if is_interactive():
+            cap = self._max_live_windows
+            new = figs if cap is None else figs[-cap:]
+            _promote_figures(new, nums=[self._records[fig].number for fig in new])
+            self._enforce_window_cap(keep=new)
+        return figs
+
+    def _register_one(self, fig, fignum=None):
+        # if the user closes the figure by any other mechanism, drop our
+        # reference to it.  This is important for getting a "pyplot" like user
+        # experience.  The dispatcher is shared by every figure (connecting it
+        # again is a no-op) so it is never disconnected.
+        fig.canvas.mpl_connect("close_event", _dispatch_close_event)
+        fig.canvas.mpl_connect("draw_event", _dispatch_draw_event)
+        if self._max_live_windows is not None:
+            for event in _interaction_events:
+                fig.canvas.mpl_connect(event, _dispatch_interaction)
+        # Make sure we give the figure a quasi-unique label.  We will never set
+        # the same label twice, but will not over-ride any user label (but
+        # empty string) on a Figure so if they provide duplicate labels, change
+        # the labels under us, or provide a label that will be shadowed in the
+        # future it will be what it is.
+        if fignum is None:
+            fignum = self._next_num
+        # claim the number right away, collecting a Figure (which can happen
+        # on any allocation) steps _next_num back down to the largest in use
+        self._number_to_fig[fignum] = fig
+        self._next_num = max(self._next_num, fignum + 1)
+        if fig.get_label() == "":
+            fig.set_label(f"{self._prefix}{fignum:d}")
+        label = fig.get_label()
+        record = self._records[fig] = _FigureRecord(
+            fignum,
+            label,
+            fig.add_callback(_dispatch_fig_changed),
+            fig.canvas.manager is not None,
+        )
+        self._index_label(fignum, label)
+        if self._weak:
+            record.finalizer = weakref.finalize(
+                fig, _forget_collected, weakref.ref(self), record
+            )
+            record.finalizer.atexit = False
+        if record.promoted:
+            self._live[fig] = None
+
+    def _index_label(self, num, label):
+        self._label_to_nums.setdefault(label, {})[num] = None
+
+    def _unindex_label(self, num, label):
+        nums = self._label_to_nums[label]
+        del nums[num]
+        if not nums:
+            del self._label_to_nums[label]
+
+    def _on_fig_changed(self, fig):
+        # called on every property change of the Figure, only re-index if the
+        # label is what changed
+        label = fig.get_label()
+        record = self._records[fig]
+        if record.label != label:
+            self._unindex_label(record.number, record.label)
+            self._index_label(record.number, label)
+            record.label = label
+
+    def _on_promotion(self, fig, promoted):
+        self._records[fig].promoted = promoted
+        self._live.pop(fig, None)
+        if promoted:
+            self._live[fig] = None
+            self._parked.pop(fig, None)
+
+    def _touch(self, fig):
+        # mark the window of fig as the most recently used
+        del self._live[fig]
+        self._live[fig] = None
+
+    def _enforce_window_cap(self, keep=()):
+        # demote the least recently used windows, other than those of the
+        # Figures in keep, until there are no more than max_live_windows
+        if self._max_live_windows is None:
+            return
+        while len(self._live) > self._max_live_windows:
+            fig = next(fig for fig in self._live if fig not in keep)
+            # demoting removes the Figure from _live via _on_promotion
+            _demote_figure(fig)
+            self._parked[fig] = None
+
+    def _unregister_fig(self, fig):
+        record = self._records.pop(fig)
+        self._live.pop(fig, None)
+        self._parked.pop(fig, None)
+        if record.finalizer is not None:
+            record.finalizer.detach()
+        fig.remove_callback(record.label_cid)
+        self._forget(record)
+
+    def _forget(self, record):
+        # drop the indexes of a Figure that has been closed, or collected if
+        # we only hold weak references to it (in which case the weak
+        # containers may have dropped it already)
+        self._number_to_fig.pop(record.number, None)
+        # the decrements can never outnumber the increments in _register_fig
+        # so this is amortized O(1)
+        while self._next_num and not self._in_use(self._next_num - 1):
+            self._next_num -= 1
+        self._unindex_label(record.number, record.label)
+
+    def _in_use(self, num):
+        return num in self._number_to_fig or num in self._lazy
+
+    def _resolve_number(self, val, action):
+        # the number of the Figure given as for close, called directly from
+        # the public methods so the warning points at the caller
+        if isinstance(val, str):
+            nums = self._label_to_nums[val]
+            if len(nums) > 1:
+                multiples = {val: len(nums)}
+                warnings.warn(
+                    (
+                        f"There are repeated labels ({multiples!r}), but only the "
+                        "newest figure with that label can be returned. "
+                    ),
+                    stacklevel=3,
+                )
+            return max(nums)
+        elif isinstance(val, int):
+            if not self._in_use(val):
+                raise KeyError(val)
+            return val
+        if val not in self._records:
+            raise ValueError(
+                f"Trying to {action} a figure not associated with this Registry."
+            )
+        return self._records[val].number
+
+    def _get_by_number(self, num):
+        if num in self._lazy:
+            return self._build(num)
+        return self._number_to_fig[num]
+
+    def _build(self, num):
+        builder, record = self._lazy[num]
+        fig = builder()
+        if fig in self._records:
+            raise ValueError(
+                "The builder of a lazy figure must not register the Figure."
+            )
+        # swap the placeholder for the real Figure under the same number
+        del self._lazy[num]
+        self._unindex_label(num, record.label)
+        fig.set_label(record.label)
+        self._register_figs([fig], nums=[num])
+        return fig
+
+    def _build_all(self):
+        for num in list(self._lazy):
+            self._build(num)
+
+    def lazy_figure(self, builder, *, label=None):
+        """
+        Register a Figure that is only built when it is first needed.
+
+        The Figure gets its number and label right away, but *builder* is
+        only called (once) the first time the Figure is looked up (in
+        `by_label` or `by_number`, by `figures` or by passing its number or
+        label to a method), shown or exported.  Listing the numbers or labels
+        does not build it, and closing it before then throws it away without
+        building it.
+
+        Parameters
+        ----------
+        builder : Callable[[], Figure]
+            Called with no arguments to create the Figure, for example with
+            `mpl_gui.figure` or `mpl_gui.subplots` (not with this Registry,
+            which registers the Figure it returns).
+
+        label : str, optional
+            The label of the Figure, which replaces any label set by
+            *builder*.  Defaults to the prefix and the number.
+
+        Returns
+        -------
+        int
+            The number of the Figure.
+        """
+        num = self._next_num
+        self._next_num += 1
+        if label is None:
+            label = f"{self._prefix}{num:d}"
+        self._lazy[num] = (builder, _FigureRecord(num, label, None, False))
+        self._index_label(num, label)
+        return num
+
+    def status(self, val):
+        """
+        Return what the Registry knows about one of its Figures.
+
+        This is answered from the Registry's own bookkeeping, without
+        looking at (or promoting) the Figure.
+
+        Parameters
+        ----------
+        val : int or str or Figure
+            The Figure, or its number or label (as for `.FigureRegistry.close`).
+
+        Returns
+        -------
+        dict
+            With the keys
+
+            - ``number``, ``label``: as in `by_number` and `by_label`
+            - ``promoted``: if the Figure has a GUI window
+            - ``created``: when it was registered (as from `time.time`)
+            - ``draw_count``, ``last_draw``: how many times it has been drawn
+              and when it was last drawn (None if never)
+
+            This does not build a lazy Figure, until it is built ``created``
+            is when it was registered with `.FigureRegistry.lazy_figure`.
+        """
+        num = self._resolve_number(val, "get the status of")
+        if num in self._lazy:
+            _, record = self._lazy[num]
+        else:
+            record = self._records[self._number_to_fig[num]]
+        return record._asdict()
+
+    @property
+    def by_label(self):
+        """
+        Return a mapping of the current labels -> figures.
+
+        The labels are in the order of the numbers of their Figures.  If
+        there are duplicate labels, newer figures will take precedence.
+        Lazy Figures are only built when they are looked up.
+        """
+        numbers = self.by_number
+        nums = {}
+        for num in numbers:
+            nums[self._label_of(num, numbers._figs)] = num
+        if len(nums) != len(numbers):
+            multiples = {
+                k: len(v) for k, v in self._label_to_nums.items() if len(v) > 1
+            }
+            warnings.warn(
+                (
+                    f"There are repeated labels ({multiples!r}), but only the newest figure with that label can "
+                    "be returned. "
+                ),
+                stacklevel=2,
+            )
+        return _FigureMapping(self, nums, numbers._figs)
+
+    @property
+    def by_number(self):
+        """
+        Return a mapping of the current numbers -> figures.
+
+        The numbers are the ones assigned by this Registry, in order.
+        Figures are not promoted to a GUI window by looking them up, and lazy
+        Figures are only built when they are looked up.
+        """
+        # a strong copy, so no Figure is collected while the mapping is used
+        figs = dict(self._number_to_fig)
+        nums = {num: num for num in sorted([*figs, *self._lazy])}
+        return _FigureMapping(self, nums, figs)
+
+    def _label_of(self, num, figs):
+        if num in figs:
+            return self._records[figs[num]].label
+        return self._lazy[num][1].label
+
+    @functools.wraps(figure)
+    def figure(self, *args, **kwargs):
+        fig = figure(*args, **kwargs)
+        return self._register_fig(fig)
+
+    @functools.wraps(subplots)
+    def subplots(self, *args, **kwargs):
+        fig, axs = subplots(*args, **kwargs)
+        return self._register_fig(fig), axs
+
+    @functools.wraps(subplot_mosaic)
+    def subplot_mosaic(self, *args, **kwargs):
+        fig, axd = subplot_mosaic(*args, **kwargs)
+        return self._register_fig(fig), axd
+
+    def subplots_many(self, n, *args, **kwargs):
+        """
+        Create and register *n* Figures with the same layout of subplots.
+
+        This is equivalent to calling `.FigureRegistry.subplots` *n* times,
+        but the registration is done in one pass and, if in interactive
+        mode, the Figures are all promoted after they are all registered.
+
+        Parameters
+        ----------
+        n : int
+            The number of Figures to create.
+
+        *args, **kwargs
+            Passed to `.subplots` for every Figure.  A *label*, if passed,
+            will be shared by all of the Figures.
+
+        Returns
+        -------
+        list[tuple[Figure, Axes or array of Axes]]
+            The ``(fig, axs)`` pair for each new Figure, in the order they
+            were numbered.
+        """
+        pairs = [subplots(*args, **kwargs) for _ in range(n)]
+        self._register_figs([fig for fig, _ in pairs])
+        return pairs
+
+    def _ensure_all_figures_promoted(self):
+        """Promote the Figures to show, and return them."""
+        numbers = self.by_number
+        nums = list(numbers)
+        cap = self._max_live_windows
+        if cap is not None:
+            # promote the newest Figures that fit and then make room for them
+            # by demoting the least recently used other windows
+            nums = nums[-cap:]
+        figs = [numbers[num] for num in nums]
+        new = [f for f in figs if f.canvas.manager is None]
+        _promote_figures(new, nums=[self._records[f].number for f in new])
+        self._enforce_window_cap(keep=figs)
+        return figs
+
+    def show_figure(self, val):
+        """
+        Show one Figure, giving it a GUI window if it does not have one.
+
+        With *max_live_windows* this is how a demoted Figure is brought
+        back, and the least recently used other window is demoted if needed.
+
+        Parameters
+        ----------
+        val : int or str or Figure
+            The Figure, or its number or label (as for `.FigureRegistry.close`).
+
+        Returns
+        -------
+        Figure
+        """
+        fig = self._get_by_number(self._resolve_number(val, "show"))
+        if fig.canvas.manager is None:
+            _promote_figures([fig], nums=[self._records[fig].number])
+        else:
+            self._touch(fig)
+        self._enforce_window_cap(keep=(fig,))
+        display(fig, block=False)
+        return fig
+
+    def show_all(self, *, block=None, timeout=None):
+        """
+        Show all of the Figures that the FigureRegistry knows about.
+
+        Only the work that is needed is done: Figures without a window are
+        promoted and shown, and of the Figures that are already shown only
+        the stale ones are redrawn.
+
+        Parameters
+        ----------
+        block : bool, optional
+            Whether to wait for all figures to be closed before returning from
+            show_all.
+
+            If `True` block and run the GUI main loop until all figure windows
+            are closed.
+
+            If `False` ensure that all figure windows are displayed and return
+            immediately.  In this case, you are responsible for ensuring
+            that the event loop is running to have responsive figures.
+
+            Defaults to the value set on the Registry at init
+
+        timeout : float, optional
+            time to wait for all of the Figures to be closed if blocking.
+
+            If 0 block forever.
+
+            Defaults to the timeout set on the Registry at init
+        """
+        if block is None:
+            block = self._block
+
+        if timeout is None:
+            timeout = self._timeout
+        figs = self._ensure_all_figures_promoted()
+        display(*figs, block=block, timeout=timeout)
+
+    # alias to easy pyplot compatibility
+    show = show_all
+
+    async def show_all_async(self, *, timeout=None, interval=0.01):
+        """
+        Show all of the Figures and wait for them to be closed from asyncio.
+
+        See `.display_async` for details.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            How long, in seconds, to process GUI events for.  If 0, return
+            once all of the figure windows are closed.
+
+            Defaults to the timeout set on the Registry at init
+
+        interval : float, optional
+            Seconds to yield to the asyncio event loop between processing
+            the pending GUI events.
+        """
+        if timeout is None:
+            timeout = self._timeout
+        figs = self._ensure_all_figures_promoted()
+        await display_async(*figs, timeout=timeout, interval=interval)
+
+    def export_all(
+        self, directory, *, format="png", workers=None, executor="thread", **kwargs
+    ):
+        """
+        Save every Figure known to this Registry into *directory*.
+
+        The Figures are rendered with Agg by a pool of workers, so this does
+        not depend on (or draw to) the GUI canvas of promoted Figures.
+
+        Parameters
+        ----------
+        directory : str or path-like
+            Where to write the files, it will be created if needed.  The
+            files are named ``{number}_{label}.{format}``.
+
+        format : str, default: "png"
+            The file format, passed to `~matplotlib.figure.Figure.savefig`.
+
+        workers : int, optional
+            The number of workers, defaults to the executor's default.
+
+        executor : {"thread", "process"}, default: "thread"
+            Render in a thread pool or in a process pool.  With threads
+            copies of the Figures (made by pickling them) are rendered, with
+            processes the Figures are pickled to the workers.
+
+        **kwargs
+            Passed to `~matplotlib.figure.Figure.savefig`.
+
+        Returns
+        -------
+        iterator of (Figure, pathlib.Path)
+            Yields each Figure and the file it was saved to as soon as the
+            file is written.  The work starts before this returns.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        self._build_all()
+        items = [
+            (fig, directory / f"{r.number:d}_{_safe_name(r.label)}.{format}")
+            for fig, r in self._records.items()
+        ]
+        return _export_figures(
+            items, workers=workers, executor=executor, format=format, **kwargs
+        )
+
+    def close_all(self, *, release=False):
+        """
+        Close all Figures know to this Registry.
+
+        This will do four things:
+
+        1. call the ``.destory()`` method on the manager
+        2. clears the Figure on the canvas instance
+        3. replace the canvas on each Figure with a new `~matplotlib.backend_bases.FigureCanvasBase` instance
+        4. drops its hard reference to the Figure
+
+        If the user still holds a reference to the Figure it can be revived by
+        passing it to `mpl_gui.display`.
+
+        Parameters
+        ----------
+        release : bool, default: False
+            Also take the Figures apart so that their memory is returned
+            right away, see `.FigureRegistry.close`.
+
+        """
+        for num in list(self._lazy):
+            self.close(num)
+        for fig in list(self._records):
+            self.close(fig, release=release)
+
+    def close(self, val, *, release=False):
+        """
+        Close (meaning destroy the UI) and forget a managed Figure.
+
+        This will do two things:
+
+        - start the destruction process of an UI (the event loop may need to
+          run to complete this process and if the user is holding hard
+          references to any of the UI elements they may remain alive).
+        - Remove the `~matplotlib.figure.Figure` from this Registry.
+
+        We will no longer have any hard references to the Figure, but if
+        the user does the `~matplotlib.figure.Figure` (and its components) will not be garbage
+        collected.  Due to the circular references in Matplotlib these
+        objects may not be collected until the full cyclic garbage collection
+        runs.
+
+        If the user still has a reference to the `~matplotlib.figure.Figure` they can re-show the
+        figure via `show`, but the `.FigureRegistry` will not be aware of it.
+
+        Parameters
+        ----------
+        val : 'all' or int or str or Figure
+
+            - The special case of 'all' closes all open Figures
+            - If any other string is passed, it is interpreted as a key in
+              `by_label` and that Figure is closed
+            - If an integer it is interpreted as a key in `.FigureRegistry.by_number` and that
+              Figure is closed
+            - If it is a `~matplotlib.figure.Figure` instance, then that figure is closed
+
+        release : bool, default: False
+            If True, also break the reference cycles that hold on to the
+            memory of the Figure: the renderers cached on its canvases are
+            dropped and the Figure is cleared (removing its Axes and artists)
+            and disconnected from all of its callbacks.  The bulk of the
+            memory is then returned as soon as nothing else references it,
+            only the empty Figure is left for the cyclic garbage collector.
+
+            The Figure is empty afterwards, so only use this if it is not
+            going to be looked at again.  As its callbacks are gone, it is
+            also closed in any other Registry that holds it.
+
+        """
+        if val == "all":
+            self.close_all(release=release)
+            return
+        # or do we want to close _all_ of the figures with a given label / number?
+        num = self._resolve_number(val, "close")
+        if num in self._lazy:
+            # never built, so there is nothing else to clean up
+            self._forget(self._lazy.pop(num)[1])
+            return
+        self._close_fig(self._number_to_fig[num], release=release)
+
+    def _close_fig(self, fig, *, release=False, pool=True):
+        # forget the figure first so we ignore the close_event the manager
+        # may emit while being destroyed
+        self._unregister_fig(fig)
+        canvas = fig.canvas
+        if (scheduler := _current_draw_scheduler()) is not None:
+            # while the canvas is still alive to stop a timer running on it
+            scheduler.discard(fig)
+        if (manager := canvas.manager) is not None:
+            # hand the window back to the pool if there is room, which takes
+            # the figure off of the canvas for us
+            if not (pool and _release_manager(manager)):
+                manager.destroy()
+                # disconnect figure from canvas
+                fig.canvas.figure = None
+            # disconnect canvas from figure
+            _FigureCanvasBase(figure=fig)
+        assert fig.canvas.manager is None
+        if release:
+            # releasing disconnects the callbacks every Registry relies on to
+            # track the Figure, so none of them may keep it
+            for registry in list(_registries):
+                if fig in registry._records:
+                    registry._unregister_fig(fig)
+            _release_figure(fig, canvas)
+        return
+
+
+class FigureContext(FigureRegistry):
+    """
+    Extends FigureRegistry to be used as a context manger.
+
+    All figures known to the Registry will be shown on exiting the context.
+
+    Parameters
+    ----------
+    block : bool, optional
+        Whether to wait for all figures to be closed before returning from
+        show_all.
+
+        If `True` block and run the GUI main loop until all figure windows
+        are closed.
+
+        If `False` ensure that all figure windows are displayed and return
+        immediately.  In this case, you are responsible for ensuring
+        that the event loop is running to have responsive figures.
+
+        Defaults to True in non-interactive mode and to False in interactive
+        mode (see `.is_interactive`).
+
+    timeout : float, optional
+        Default time to wait for all of the Figures to be closed if blocking.
+
+        If 0 block forever.
+
+    forgive_failure : bool, optional
+        If True, block to show the figure before letting the exception
+        propagate
+
+    """
+
+    def __init__(self, *, forgive_failure=False, **kwargs):
+        super().__init__(**kwargs)
+        self._forgive_failure = forgive_failure
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_value is not None and not self._forgive_failure:
+            return
+        display(
+            *self._ensure_all_figures_promoted(),
+            block=self._block,
+            timeout=self._timeout,
+        )
@@ -0,0 +1,47 @@
+"""Take apart closed Figures so that their memory is returned right away."""
+
+from matplotlib import cbook
+from matplotlib.backend_bases import FigureCanvasBase
+
+from ._render_cache import current_render_cache
+
+
+def release_figure(fig, *canvases):
+    """
+    Break up a closed Figure so most of it is freed by reference counting.
+
+    Matplotlib's object graph is full of reference cycles (the Figure and its
+    canvas, the manager and its canvas, every artist and its Figure and Axes)
+    so a closed Figure is otherwise only freed when the cyclic garbage
+    collector runs.  This drops the parts that hold the memory out of those
+    cycles: the renderers cached on the canvases, the artists (with their
+    data) and the callbacks, which may close over anything.  What is left is
+    the empty shell of the Figure and its Axes.
+
+    The Figure is left empty, with nothing connected to it, but is otherwise
+    still usable.
+
+    Parameters
+    ----------
+    fig : Figure
+        The Figure, which must already be closed.
+
+    *canvases : FigureCanvasBase
+        Canvases the Figure was on in addition to its current one.
+    """
+    for canvas in {fig.canvas, *canvases}:
+        # the Agg buffer is only referenced from here, with _lastKey reset the
+        # canvas makes a new one if it is ever drawn again
+        canvas.__dict__.pop("renderer", None)
+        canvas.__dict__.pop("_lastKey", None)
+        canvas._blit_backgrounds = {}
+        canvas.mouse_grabber = None
+    if (cache := current_render_cache()) is not None:
+        cache.discard(fig)
+    fig.stale_callback = None
+    # Figure.clear removes the Axes (and subfigures), which drop their
+    # artists, so the artists are not in a cycle any more
+    fig.clear()
+    fig._canvas_callbacks = cbook.CallbackRegistry(signals=FigureCanvasBase.events)
+    fig.callbacks = cbook.CallbackRegistry(signals=["dpi_changed"])
+    fig._callbacks = cbook.CallbackRegistry(signals=["pchanged"])
@@ -0,0 +1,124 @@
+"""Re-use the pixels of Figures that have not changed since they were drawn."""
+
+import weakref
+
+
+_cache = None
+
+
+class RenderCache:
+    """
+    The last rendered pixels of each Figure drawn with an Agg canvas.
+
+    After every draw a copy of the canvas' Agg buffer is kept.  When a
+    Figure is shown again (re-shown, raised or promoted to a new window)
+    and it is not stale and its size has not changed, the copy is put back
+    on the canvas and blitted to the screen instead of rendering it again.
+
+    Attributes
+    ----------
+    hits : int
+        The number of times the cached pixels were used.
+    misses : int
+        The number of times the Figure had to be rendered.
+    """
+
+    def __init__(self):
+        # Figure -> (width, height, dpi), BufferRegion
+        self._buffers = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def store(self, canvas):
+        """Keep a copy of the pixels *canvas* has just rendered."""
+        if canvas.manager is None or getattr(canvas, "renderer", None) is None:
+            # not a GUI canvas (e.g. the one used by savefig), or not Agg
+            return
+        fig = canvas.figure
+        self._buffers[fig] = (_size_key(canvas), canvas.copy_from_bbox(fig.bbox))
+
+    def restore(self, canvas):
+        """
+        Put the cached pixels of the Figure back on *canvas* and blit them.
+
+        Returns False, leaving the canvas alone, if there are none or the
+        Figure has changed since.
+        """
+        fig = canvas.figure
+        # make sure that we hear about the next draw of this figure.  This is
+        # a no-op if it is already connected and lives on the Figure, so it
+        # survives promotion to another canvas
+        canvas.mpl_connect("draw_event", _store_on_draw)
+        key, region = self._buffers.get(fig, (None, None))
+        if (
+            fig.stale
+            or key != _size_key(canvas)
+            or not hasattr(canvas, "restore_region")
+        ):
+            self.misses += 1
+            return False
+        canvas.get_renderer()
+        canvas.restore_region(region)
+        canvas.blit()
+        self.hits += 1
+        return True
+
+    def discard(self, fig):
+        """Forget the pixels of *fig*."""
+        self._buffers.pop(fig, None)
+
+    def __len__(self):
+        return len(self._buffers)
+
+    def stats(self):
+        """Return the cache counters as a dict."""
+        return {"hits": self.hits, "misses": self.misses, "cached": len(self)}
+
+
+def _size_key(canvas):
+    return (*canvas.get_width_height(physical=True), canvas.figure.dpi)
+
+
+def _store_on_draw(event):
+    if _cache is not None:
+        _cache.store(event.canvas)
+
+
+def refresh_canvas(canvas):
+    """Update the screen of *canvas*, from the cache if possible."""
+    if _cache is None or not _cache.restore(canvas):
+        canvas.draw_idle()
+
+
+def current_render_cache():
+    """Return the active `RenderCache` or None if caching is disabled."""
+    return _cache
+
+
+def enable_render_cache():
+    """
+    Skip rendering Figures that are shown again without having changed.
+
+    By default every time a Figure is shown, including when its window is
+    raised or it is promoted again after being demoted, it is rendered from
+    scratch.  When enabled, a copy of the pixels of each Figure drawn with
+    an Agg based canvas is kept after every draw and, if the Figure is not
+    stale, the copy is blitted to the screen instead.
+
+    This trades memory (a copy of the buffer of each Figure) for time.
+
+    Returns
+    -------
+    RenderCache
+        The cache, which counts its hits and misses.
+    """
+    global _cache
+    disable_render_cache()
+    _cache = RenderCache()
+    return _cache
+
+
+def disable_render_cache():
+    """Stop caching and drop the cached pixels."""
+    global _cache
+    _cache = None
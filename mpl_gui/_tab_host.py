@@ -0,0 +1,208 @@
+"""Host the windows of many promoted Figures as the tabs of one window."""
+
+_host = None
+
+
+class TabCanvasMixin:
+    """
+    Mixin for the canvas of a tab that only draws when its tab is selected.
+
+    Draws requested while the tab is hidden are remembered and done when
+    the tab is selected.
+    """
+
+    _draw_pending = False
+
+    def draw_idle(self, *args, **kwargs):
+        manager = self.manager
+        if manager is not None and not manager.selected:
+            self._draw_pending = True
+            return
+        super().draw_idle(*args, **kwargs)
+
+
+class TabManagerMixin:
+    """
+    Mixin for the figure manager of a tab.
+
+    Showing the manager selects its tab and destroying it removes the tab.
+    The tab's `TabbedWindowBase` has to be set as ``tab_window`` before the
+    manager's ``__init__`` runs.
+    """
+
+    # the tab, not the window, goes away when the Figure is closed so there
+    # is nothing that could be hidden and re-used by the manager pool
+    _poolable = False
+
+    @property
+    def selected(self):
+        return self.tab_window.selected is self
+
+    def show(self):
+        self.tab_window.show()
+        self.tab_window.select(self)
+        self._shown = True
+
+    def destroy(self, *args):
+        self.tab_window.remove(self)
+
+    def get_window_title(self):
+        return self.tab_window.titles.get(self, "")
+
+    def set_window_title(self, title):
+        self.tab_window.titles[self] = title
+        if self in self.tab_window.managers:
+            self.tab_window._set_tab_title(self, title)
+
+
+class TabbedWindowBase:
+    """
+    One native window holding the managers of many Figures as tabs.
+
+    This keeps track of the tabs and which one is selected, backends
+    subclass it to provide the window.  Subclasses must implement
+    `_new_manager` and may implement the other (no-op here) toolkit hooks.
+    """
+
+    def __init__(self):
+        # in the order of the tabs
+        self.managers = []
+        self.titles = {}
+        self.selected = None
+        self.closed = False
+        self._shown = False
+
+    def add(self, fig, num):
+        """Add a tab for *fig* and return its (not yet shown) manager."""
+        manager = self._new_manager(fig, num)
+        self.managers.append(manager)
+        self._set_tab_title(manager, self.titles.get(manager, ""))
+        return manager
+
+    def show(self):
+        """Show the window."""
+        if not self._shown:
+            self._show_window()
+            self._shown = True
+
+    def select(self, manager):
+        """Bring the tab of *manager* to the front."""
+        self._select_tab(manager)
+        self._on_selected(manager)
+
+    def _on_selected(self, manager):
+        # called when a tab is selected, by us or by the user
+        if manager is self.selected:
+            return
+        self.selected = manager
+        canvas = manager.canvas
+        if canvas._draw_pending:
+            canvas._draw_pending = False
+            canvas.draw_idle()
+
+    def remove(self, manager):
+        """Remove the tab of *manager*, and the window with the last tab."""
+        if manager not in self.managers:
+            return
+        self.managers.remove(manager)
+        self.titles.pop(manager, None)
+        if self.selected is manager:
+            self.selected = None
+        self._remove_tab(manager)
+        if not self.managers:
+            self.destroy()
+        elif self.selected is None:
+            self.select(self.managers[-1])
+
+    def destroy(self):
+        """Remove all of the tabs and destroy the window."""
+        if self.closed:
+            return
+        self.closed = True
+        while self.managers:
+            manager = self.managers.pop()
+            self.titles.pop(manager, None)
+            self._remove_tab(manager)
+        self.selected = None
+        self._destroy_window()
+
+    # toolkit hooks
+
+    def _new_manager(self, fig, num):
+        raise NotImplementedError
+
+    def _set_tab_title(self, manager, title):
+        pass
+
+    def _select_tab(self, manager):
+        pass
+
+    def _remove_tab(self, manager):
+        pass
+
+    def _show_window(self):
+        pass
+
+    def _destroy_window(self):
+        pass
+
+
+class TabHost:
+    """The tabbed window of each backend that has been used."""
+
+    def __init__(self):
+        self._windows = {}
+
+    def acquire(self, backend_mod, fig, num):
+        """
+        Return a manager for *fig* in a tab, or None if the backend can not.
+        """
+        window_class = getattr(backend_mod, "TabbedWindow", None)
+        if window_class is None:
+            return None
+        window = self._windows.get(backend_mod)
+        if window is None or window.closed:
+            window = self._windows[backend_mod] = window_class()
+        return window.add(fig, num)
+
+
+def current_tab_host():
+    """Return the active `TabHost` or None if tabs are disabled."""
+    return _host
+
+
+def enable_tabbed_window():
+    """
+    Put newly promoted Figures into the tabs of a single window.
+
+    Rather than a window (with its toolbar) per Figure, each Figure gets a
+    tab, with its own toolbar, in one shared window.  Only the selected tab
+    is drawn, the others are drawn when they are selected.  Showing a
+    Figure selects its tab and closing it removes the tab.
+
+    This is only done with backends that support it (the "tkagg" and
+    "headless" backends shipped with mpl_gui), Figures promoted with other
+    backends get their own windows as usual.
+
+    .. note::
+
+       The tabbed Tk window is experimental.
+
+    Returns
+    -------
+    TabHost
+    """
+    global _host
+    disable_tabbed_window()
+    _host = TabHost()
+    return _host
+
+
+def disable_tabbed_window():
+    """
+    Give newly promoted Figures their own windows again.
+
+    The Figures already in tabs stay where they are.
+    """
+    global _host
+    _host = None
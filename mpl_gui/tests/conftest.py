@@ -5,6 +5,7 @@ from matplotlib.backend_bases import (
     ShowBase,
 )
 import mpl_gui
+import pytest
 import sys
 
 
@@ -23,6 +24,13 @@ def pytest_configure(config):
     sys.modules["matplotlib.pyplot"] = None
 
 
+@pytest.fixture
+def tabbed_window():
+    host = mpl_gui.enable_tabbed_window()
+    yield host
+    mpl_gui.disable_tabbed_window()
+
+
 class TestManger(FigureManagerBase):
     _active_managers = None
 
@@ -36,6 +44,9 @@ class TestManger(FigureManagerBase):
     def destroy(self):
         self.call_info["destroy"] = {}
 
+    def hide(self):
+        self.call_info["hide"] = {}
+
 
 class TestCanvas(FigureCanvasBase):
     manager_class = TestManger
@@ -1,8 +1,15 @@
+import asyncio
+import functools
+import gc
+import io
 import sys
+import tracemalloc
+import types
+import weakref
 
 import pytest
 
-from matplotlib.backend_bases import FigureCanvasBase
+from matplotlib.backend_bases import FigureCanvasBase, TimerBase
 
 import mpl_gui as mg
 
@@ -134,6 +141,11 @@ def test_change_labels():
         f.set_label(f"aardvark {j}")
     assert list(fr.by_label) == [f"aardvark {j}" for j in range(5)]
 
+    # the order follows the Figures, not the order they were relabeled in
+    for j, f in reversed(list(enumerate(fr.figures))):
+        f.set_label(f"zebra {j}")
+    assert list(fr.by_label) == [f"zebra {j}" for j in range(5)]
+
 
 def test_close_one_at_a_time():
     fr = mg.FigureRegistry(block=False)
@@ -159,3 +171,759 @@ def test_close_one_at_a_time():
 
     fr.close("all")
     assert len(fr.figures) == 0
+
+
+def test_close_by_index_after_relabel():
+    fr = mg.FigureRegistry(block=False)
+    figs = [fr.figure() for _ in range(5)]
+    figs[1].set_label("aardvark")
+    with pytest.raises(KeyError):
+        fr.close("Figure 1")
+    fr.close("aardvark")
+    assert figs[1] not in fr.figures
+    assert "aardvark" not in fr.by_label
+
+    figs[2].set_label("Figure 3")
+    with pytest.warns(UserWarning, match="{'Figure 3': 2}"):
+        fr.close("Figure 3")
+    assert figs[3] not in fr.figures
+    assert fr.by_label == {"Figure 0": figs[0], "Figure 3": figs[2], "Figure 4": figs[4]}
+
+    fr.close(4)
+    assert fr.figures == (figs[0], figs[2])
+    with pytest.raises(KeyError):
+        fr.close(4)
+
+
+def test_by_number_does_not_promote():
+    fr = mg.FigureRegistry(block=False)
+    figs = [fr.figure() for _ in range(3)]
+    assert fr.by_number == dict(enumerate(figs))
+    assert all(f.canvas.manager is None for f in figs)
+
+    fr.close(1)
+    assert figs[1].canvas.manager is None
+    assert fr.by_number == {0: figs[0], 2: figs[2]}
+
+    fr.show_all()
+    assert {n: f.canvas.manager.num for n, f in fr.by_number.items()} == {0: 0, 2: 2}
+
+
+def test_numbering_reuses_top():
+    fr = mg.FigureRegistry(block=False)
+    figs = [fr.figure() for _ in range(4)]
+    fr.close(figs[3])
+    fr.close(figs[2])
+    assert list(fr.by_number) == [0, 1]
+    fig = fr.figure()
+    assert fr.by_number[2] is fig
+    assert fig.get_label() == "Figure 2"
+
+    # gaps below the largest number are not filled in
+    fr.close(figs[0])
+    assert list(fr.by_number) == [1, 2]
+    fr.figure()
+    assert list(fr.by_number) == [1, 2, 3]
+
+    fr.close_all()
+    fr.figure()
+    assert list(fr.by_number) == [0]
+
+
+@pytest.mark.parametrize("interactive", [True, False])
+def test_subplots_many(interactive):
+    fr = mg.FigureRegistry(block=False)
+    fr.figure()
+    with (mg.ion if interactive else mg.ioff)():
+        pairs = fr.subplots_many(3, 1, 2, sharex=True)
+    assert len(pairs) == 3
+    figs = [fig for fig, _ in pairs]
+    assert fr.figures[1:] == tuple(figs)
+    assert list(fr.by_label) == [f"Figure {j}" for j in range(4)]
+    for fig, axs in pairs:
+        assert axs.shape == (2,)
+        assert axs[0].figure is fig
+        assert (fig.canvas.manager is not None) == interactive
+    fr.close_all()
+
+
+def test_promote_figures_batch():
+    from mpl_gui._promotion import promote_figures
+
+    figs = [mg.Figure(label=f"fig {j}") for j in range(3)]
+    existing = promote_figures(figs[:1], nums=[7])[0]
+    assert existing.num == 7
+    with mg.ion():
+        managers = promote_figures(figs)
+    assert managers[0] is existing
+    assert [m.canvas.figure for m in managers] == figs
+    assert [m.get_window_title() for m in managers] == ["fig 0", "fig 1", "fig 2"]
+    # only the newly created managers are shown
+    assert "show" not in managers[0].call_info
+    assert all("show" in m.call_info for m in managers[1:])
+
+
+def test_manager_pool():
+    pool = mg.enable_manager_pool(max_size=1, prefill=1)
+    try:
+        (prefilled, _), = pool._idle
+        fr = mg.FigureRegistry(block=False)
+        fig1, fig2 = fr.figure(label="a"), fr.figure(label="b")
+        fr.show_all()
+        m1 = fig1.canvas.manager
+        assert m1 is prefilled
+        assert m1.num == 0
+        assert m1.get_window_title() == "a"
+        m2 = fig2.canvas.manager
+
+        fr.close(fig1)
+        fr.close(fig2)
+        # the pool only has room for one window
+        assert len(pool) == 1
+        assert "hide" in m1.call_info and "destroy" not in m1.call_info
+        assert "destroy" in m2.call_info
+        assert m1.canvas.figure is not fig1
+        assert fig1.canvas.manager is None
+
+        fig3 = fr.figure(label="c")
+        fr.show_all()
+        assert fig3.canvas.manager is m1
+        assert m1.canvas.figure is fig3
+        assert m1.num == 0
+        assert m1.get_window_title() == "c"
+        # the manager's key handler moved over with the canvas
+        assert m1.key_press_handler_id in fig3._canvas_callbacks.callbacks["key_press_event"]
+        assert len(pool) == 0
+
+        mg.demote_figure(fig3)
+        assert len(pool) == 1
+        assert fig3.canvas.manager is None
+        pool.idle_timeout = 0
+        pool.evict_idle()
+        assert len(pool) == 0
+        assert "destroy" in m1.call_info
+    finally:
+        mg.disable_manager_pool()
+
+
+def test_manager_pool_user_closed():
+    from matplotlib.backend_bases import CloseEvent
+
+    pool = mg.enable_manager_pool(max_size=1)
+    try:
+        fr = mg.FigureRegistry(block=False)
+        fig = fr.figure()
+        fr.show_all()
+        manager = fig.canvas.manager
+        # the user closing the window destroys it, it can not be re-used
+        CloseEvent("close_event", fig.canvas)._process()
+        assert not fr.figures
+        assert len(pool) == 0
+        assert "destroy" in manager.call_info
+        assert "hide" not in manager.call_info
+        assert fig.canvas.manager is None
+    finally:
+        mg.disable_manager_pool()
+
+
+def test_manager_pool_evicts_on_timer(manual_timer):
+    pool = mg.enable_manager_pool(max_size=2, idle_timeout=0)
+    try:
+        fr = mg.FigureRegistry(block=False)
+        fig = fr.figure()
+        fr.show_all()
+        manager = fig.canvas.manager
+        fr.close(fig)
+        assert len(pool) == 1
+        # the window is freed by the timer, without the pool being used again
+        (timer,) = manual_timer
+        timer._on_timer()
+        assert len(pool) == 0
+        assert "destroy" in manager.call_info
+        assert manual_timer == []
+    finally:
+        mg.disable_manager_pool()
+
+
+class _ManualTimer(TimerBase):
+    # a timer that "runs", but only fires when the test says so
+    started = []
+
+    def _timer_start(self):
+        self.started.append(self)
+
+    def _timer_stop(self):
+        if self in self.started:
+            self.started.remove(self)
+
+
+@pytest.fixture
+def manual_timer(monkeypatch):
+    from mpl_gui._manage_backend import current_backend_module
+
+    canvas_class = current_backend_module().FigureCanvas
+    monkeypatch.setattr(canvas_class, "_timer_cls", _ManualTimer)
+    _ManualTimer.started.clear()
+    yield _ManualTimer.started
+    _ManualTimer.started.clear()
+
+
+def test_draw_coalescing(manual_timer):
+    scheduler = mg.enable_draw_coalescing(fps=30)
+    try:
+        with mg.ion():
+            figs = [mg.Figure() for _ in range(2)]
+            mg.display(*figs)
+            draws = []
+            for fig in figs:
+                fig.canvas.draw_idle = functools.partial(draws.append, fig)
+            for _ in range(5):
+                for fig in figs:
+                    ax = fig.add_subplot()
+                    ax.stale = True
+        assert scheduler.stats()["pending"] == 2
+        assert scheduler.dropped == scheduler.requested - 2
+        assert len(manual_timer) == 1
+        manual_timer[0]._on_timer()
+        assert scheduler.drawn == 2
+        assert draws == figs
+        assert scheduler.stats()["pending"] == 0
+        assert manual_timer == []
+    finally:
+        mg.disable_draw_coalescing()
+
+
+def test_draw_coalescing_without_timer():
+    # the test canvas, like Agg, has a TimerBase which never fires so the
+    # redraws have to be done right away
+    scheduler = mg.enable_draw_coalescing(fps=30)
+    try:
+        with mg.ion():
+            fig = mg.Figure()
+            mg.display(fig)
+            draws = []
+            fig.canvas.draw_idle = functools.partial(draws.append, fig)
+            fig.add_subplot().stale = True
+        assert draws
+        assert scheduler.stats()["pending"] == 0
+    finally:
+        mg.disable_draw_coalescing()
+
+
+def test_draw_coalescing_timer_moves_on_close(manual_timer):
+    mg.enable_draw_coalescing(fps=30)
+    try:
+        fr = mg.FigureRegistry()
+        with mg.ion():
+            figs = [fr.figure() for _ in range(2)]
+            fr.show_all(block=False)
+            draws = []
+            for fig in figs:
+                fig.canvas.draw_idle = functools.partial(draws.append, fig)
+                fig.add_subplot().stale = True
+        (timer,) = manual_timer
+        # the timer is on the canvas of the first figure, which goes away
+        fr.close(figs[0])
+        assert timer not in manual_timer
+        (timer,) = manual_timer
+        timer._on_timer()
+        assert draws == [figs[1]]
+    finally:
+        mg.disable_draw_coalescing()
+
+
+def test_draw_coalescing_demote(manual_timer):
+    scheduler = mg.enable_draw_coalescing(fps=30)
+    try:
+        with mg.ion():
+            fig = mg.Figure()
+            mg.display(fig)
+            fig.add_subplot().stale = True
+        assert scheduler.stats()["pending"] == 1
+        mg.demote_figure(fig)
+        assert scheduler.stats()["pending"] == 0
+        assert manual_timer == []
+    finally:
+        mg.disable_draw_coalescing()
+
+
+def test_draw_coalescing_holds_weakly(manual_timer):
+    scheduler = mg.enable_draw_coalescing(fps=30)
+    try:
+        with mg.ion():
+            fig = mg.Figure()
+            mg.display(fig)
+            fig.add_subplot().stale = True
+        ref = weakref.ref(fig)
+        del fig
+        gc.collect()
+        assert ref() is None
+        assert scheduler.stats()["pending"] == 0
+    finally:
+        mg.disable_draw_coalescing()
+
+
+def test_display_async():
+    from matplotlib.backend_bases import CloseEvent
+
+    flushes = []
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def main(fig):
+        task = asyncio.create_task(ticker())
+        await mg.display_async(fig, timeout=0.05, interval=0)
+        assert len(flushes) > 1
+        assert len(ticks) > 1
+        # closing the window ends the wait
+        fig.canvas.flush_events = lambda: CloseEvent("close_event", fig.canvas)._process()
+        await mg.display_async(fig, interval=0)
+        task.cancel()
+
+    fig = mg.Figure()
+    mg.display(fig, block=False)
+    fig.canvas.flush_events = lambda: flushes.append(None)
+    asyncio.run(main(fig))
+    assert "show" in fig.canvas.manager.call_info
+
+
+def test_show_all_async():
+    fr = mg.FigureRegistry(block=False, timeout=0.01)
+    figs = [fr.figure() for _ in range(3)]
+    asyncio.run(fr.show_all_async())
+    assert all("show" in f.canvas.manager.call_info for f in figs)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_export_all(tmp_path, executor):
+    fr = mg.FigureRegistry(block=False)
+    for j in range(4):
+        fig, ax = fr.subplots()
+        ax.plot(range(j + 2))
+    fr.figures[1].set_label("a/b c")
+    fr.show_all()
+    canvases = [fig.canvas for fig in fr.figures]
+
+    results = dict(fr.export_all(tmp_path / "out", workers=2, executor=executor, dpi=10))
+    assert set(results) == set(fr.figures)
+    assert sorted(p.name for p in results.values()) == [
+        "0_Figure_0.png",
+        "1_a_b_c.png",
+        "2_Figure_2.png",
+        "3_Figure_3.png",
+    ]
+    assert all(p.read_bytes().startswith(b"\x89PNG") for p in results.values())
+    # the GUI canvases were left in place
+    assert [fig.canvas for fig in fr.figures] == canvases
+
+    with pytest.raises(ValueError, match="executor"):
+        fr.export_all(tmp_path, executor="gpu")
+
+
+def test_export_all_renders_copies(tmp_path, monkeypatch):
+    import pickle
+
+    from matplotlib.figure import Figure
+
+    fr = mg.FigureRegistry(block=False)
+    for j in range(3):
+        fr.subplots()[1].plot(range(j + 2))
+    fr.show_all()
+    saved = []
+    savefig = Figure.savefig
+
+    def spy(self, *args, **kwargs):
+        saved.append(self)
+        return savefig(self, *args, **kwargs)
+
+    copied = []
+    dumps = pickle.dumps
+
+    def copy_spy(obj, *args, **kwargs):
+        copied.append(obj)
+        return dumps(obj, *args, **kwargs)
+
+    monkeypatch.setattr(Figure, "savefig", spy)
+    monkeypatch.setattr(pickle, "dumps", copy_spy)
+    results = fr.export_all(tmp_path, workers=1, dpi=10)
+    # the copies are made as the results are consumed, not all up front
+    assert len(copied) == 1
+    results = dict(results)
+    assert copied == list(fr.figures)
+    assert set(results) == set(fr.figures)
+    # the worker threads only ever saw copies of the Figures
+    assert len(saved) == 3
+    assert not any(fig in fr.figures for fig in saved)
+
+
+def test_close_event_dispatcher():
+    from matplotlib.backend_bases import CloseEvent, KeyEvent
+
+    fr = mg.FigureRegistry(block=False)
+    figs = [fr.figure() for _ in range(3)]
+    fr.show_all()
+    # one shared dispatcher rather than a closure per figure
+    (handler_0,) = figs[0]._canvas_callbacks.callbacks["close_event"].values()
+    (handler_1,) = figs[1]._canvas_callbacks.callbacks["close_event"].values()
+    assert handler_0() is handler_1()
+
+    CloseEvent("close_event", figs[1].canvas)._process()
+    assert fr.figures == (figs[0], figs[2])
+    # a figure can be in more than one registry
+    fr2 = mg.FigureRegistry(block=False)
+    fr2._register_fig(figs[0])
+    (handler_0,) = figs[0]._canvas_callbacks.callbacks["close_event"].values()
+    assert handler_0() is handler_1()
+    CloseEvent("close_event", figs[0].canvas)._process()
+    assert fr.figures == (figs[2],)
+    assert fr2.figures == ()
+
+    manager = figs[2].canvas.manager
+    KeyEvent("key_press_event", figs[2].canvas, key="q")._process()
+    assert "destroy" in manager.call_info
+
+
+def test_status():
+    fr = mg.FigureRegistry(block=False)
+    fig = fr.figure(label="a")
+    status = fr.status("a")
+    assert status == fr.status(0) == fr.status(fig)
+    assert status["number"] == 0
+    assert status["label"] == "a"
+    assert not status["promoted"]
+    assert status["draw_count"] == 0
+    assert status["last_draw"] is None
+
+    fr.show_all()
+    fig.set_label("b")
+    fig.draw_without_rendering()
+    status = fr.status("b")
+    assert status["promoted"]
+    assert status["label"] == "b"
+    assert status["draw_count"] == 1
+    assert status["last_draw"] >= status["created"]
+
+    fr.close(fig)
+    with pytest.raises(ValueError, match="get the status of"):
+        fr.status(fig)
+
+
+def test_weak_retain():
+    fr = mg.FigureRegistry(retain="weak")
+    kept = fr.figure(label="kept")
+    fr.figure(label="dropped")
+    gc.collect()
+    assert fr.figures == (kept,)
+    assert fr.by_number == {0: kept}
+    assert fr.by_label == {"kept": kept}
+    # the number of the collected figure is free again
+    assert fr.figure().get_label() == "Figure 1"
+
+    # figures with a window are kept alive
+    fr.show_all(block=False)
+    shown = fr.figures
+    del shown
+    gc.collect()
+    assert len(fr.figures) == 2
+    fr.close_all()
+    assert fr.figures == ()
+
+    with pytest.raises(ValueError):
+        mg.FigureRegistry(retain="soft")
+
+
+def test_weak_retain_memory_is_flat():
+    fr = mg.FigureRegistry(retain="weak")
+
+    def churn(n):
+        for j in range(n):
+            fr.figure(figsize=(1, 1), label=f"churn {j}")
+            if j % 1000 == 999:
+                gc.collect()
+        gc.collect()
+
+    churn(500)
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        churn(10_000)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert fr.figures == ()
+    assert fr._label_to_nums == {}
+    # a single Figure is ~100 kB, so 10k leaked Figures would be ~1 GB
+    assert after - before < 256 * 1024
+
+
+def test_close_release():
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fr = mg.FigureRegistry()
+    fig, ax = fr.subplots()
+    (line,) = ax.plot(range(10))
+    FigureCanvasAgg(fig).draw()
+    refs = [weakref.ref(obj) for obj in (fig.canvas.renderer, line)]
+    del ax, line
+
+    gc.disable()
+    try:
+        fr.close(fig, release=True)
+        assert [ref() for ref in refs] == [None, None]
+    finally:
+        gc.enable()
+    assert fig.axes == []
+    assert fr.figures == ()
+
+    # the promoted case, through close_all
+    fig = fr.figure()
+    fr.show_all(block=False)
+    canvas = fig.canvas
+    fr.close_all(release=True)
+    assert fig.canvas is not canvas
+    assert canvas.figure is None
+
+
+def test_close_release_other_registry():
+    fr1 = mg.FigureRegistry(block=False)
+    fr2 = mg.FigureRegistry(block=False)
+    fig = fr1.figure(label="x")
+    fr2._register_fig(fig)
+    fr1.close(fig, release=True)
+    # the other Registry could no longer track it, so it let it go too
+    assert fr2.figures == ()
+    assert list(fr2.by_label) == []
+    fig.set_label("y")
+    assert list(fr2.by_label) == []
+
+
+def test_max_live_windows():
+    from matplotlib.backend_bases import MouseEvent
+
+    fr = mg.FigureRegistry(max_live_windows=2)
+    figs = [fr.figure() for _ in range(4)]
+    fr.show_all(block=False)
+    # only the newest fit
+    assert [f.canvas.manager is not None for f in figs] == [False, False, True, True]
+
+    # bringing one back demotes the least recently used window
+    assert fr.show_figure(0) is figs[0]
+    manager = figs[0].canvas.manager
+    assert manager.num == 0
+    assert manager.get_window_title() == "Figure 0"
+    assert figs[2].canvas.manager is None
+    assert fr.status(2)["promoted"] is False
+    assert fr.by_number[2] is figs[2]
+
+    # using a window makes it the most recently used
+    MouseEvent("button_press_event", figs[3].canvas, 0, 0)._process()
+    fr.show_figure("Figure 1")
+    assert figs[0].canvas.manager is None
+    assert figs[3].canvas.manager is not None
+    assert fr.figures == tuple(figs)
+
+    with pytest.raises(ValueError):
+        mg.FigureRegistry(max_live_windows=0)
+
+
+def test_demote_figure_keeps_registry():
+    from matplotlib.backend_bases import CloseEvent
+
+    fr = mg.FigureRegistry()
+    fig = fr.figure()
+    fr.show_all(block=False)
+    manager = fig.canvas.manager
+    destroy = manager.destroy
+
+    def destroy_emitting_close():
+        # like closing the window of a GUI toolkit
+        CloseEvent("close_event", manager.canvas)._process()
+        destroy()
+
+    manager.destroy = destroy_emitting_close
+    mg.demote_figure(fig)
+    assert "destroy" in manager.call_info
+    assert fig.canvas.manager is None
+    assert fr.figures == (fig,)
+
+
+def test_lazy_figure(tmp_path):
+    built = []
+
+    def builder():
+        fig, ax = mg.subplots()
+        ax.plot(range(3))
+        built.append(fig)
+        return fig
+
+    fr = mg.FigureRegistry()
+    eager = fr.figure()
+    assert fr.lazy_figure(builder, label="lazy") == 1
+    assert fr.lazy_figure(builder) == 2
+    assert fr.status("lazy")["number"] == 1
+    assert fr.status(2)["label"] == "Figure 2"
+    assert built == []
+
+    # closing an unbuilt figure never builds it
+    fr.close(2)
+    assert built == []
+    assert fr.figure().get_label() == "Figure 2"
+
+    # looking it up builds it, once
+    (fig,) = [fr.show_figure("lazy")]
+    assert built == [fig]
+    assert fig.get_label() == "lazy"
+    assert fr.by_number[1] is fig
+    assert fr.by_label["lazy"] is fig
+    assert built == [fig]
+
+    fr.lazy_figure(builder)
+    assert len(list(fr.export_all(tmp_path))) == 4
+    assert len(built) == 2
+    assert fr.figures[0] is eager
+
+    fr.lazy_figure(builder)
+    fr.close_all()
+    assert len(built) == 2
+    assert fr.by_number == {}
+
+
+def test_lazy_figure_listing():
+    built = []
+
+    def builder():
+        fig = mg.Figure()
+        built.append(fig)
+        return fig
+
+    fr = mg.FigureRegistry()
+    for j in range(5):
+        fr.lazy_figure(builder, label=f"lazy {j}")
+    fr.close(2)
+    # listing the numbers and labels builds nothing
+    assert sorted(fr.by_number) == [0, 1, 3, 4]
+    assert list(fr.by_label) == ["lazy 0", "lazy 1", "lazy 3", "lazy 4"]
+    assert len(fr.by_number) == 4
+    assert built == []
+
+    # only the Figures looked up are built
+    numbers = fr.by_number
+    assert numbers[3] is built[0]
+    assert numbers[3] is built[0]
+    assert len(built) == 1
+    # and the Figures are in number order, not the order they were built in
+    assert fr.figures == tuple(built[1:2] + built[2:3] + built[:1] + built[3:])
+    assert [f.get_label() for f in fr.figures] == list(fr.by_label)
+
+
+def test_render_cache(monkeypatch):
+    from matplotlib.backend_bases import _Backend, FigureManagerBase
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    from .conftest import TestingBackend
+
+    blits = []
+
+    class AggCanvas(FigureCanvasAgg):
+        manager_class = FigureManagerBase
+
+        def blit(self, bbox=None):
+            blits.append(self)
+
+    class AggBackend(_Backend):
+        FigureCanvas = AggCanvas
+        FigureManager = FigureManagerBase
+        mainloop = None
+
+    # select it by name to get mpl_gui's show_managers
+    module = types.ModuleType("_mpl_gui_test_agg")
+    module.Backend = AggBackend
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    mg.select_gui_toolkit(f"module://{module.__name__}")
+    cache = mg.enable_render_cache()
+    try:
+        fr = mg.FigureRegistry(block=True)
+        fig, ax = fr.subplots()
+        fr.show_all()
+        assert cache.stats() == {"hits": 0, "misses": 1, "cached": 1}
+
+        # already shown and unchanged, so there is nothing to do
+        canvas = fig.canvas
+        fr.show_all()
+        assert cache.stats() == {"hits": 0, "misses": 1, "cached": 1}
+
+        # on a new canvas the pixels are re-used
+        mg.demote_figure(fig)
+        fr.show_all()
+        assert fig.canvas is not canvas
+        assert blits == [fig.canvas]
+        assert cache.stats() == {"hits": 1, "misses": 1, "cached": 1}
+
+        # but not once changed
+        ax.plot(range(3))
+        fr.show_all()
+        assert cache.stats() == {"hits": 1, "misses": 2, "cached": 1}
+
+        # saving at another dpi renders (and caches) the wrong size
+        fig.savefig(io.BytesIO(), dpi=20)
+        fr.show_all()
+        assert cache.stats() == {"hits": 1, "misses": 3, "cached": 1}
+        mg.demote_figure(fig)
+        fr.show_all()
+        assert cache.hits == 2
+    finally:
+        mg.disable_render_cache()
+        mg.select_gui_toolkit(TestingBackend)
+
+
+def test_max_live_windows_show_all_new_figure():
+    fr = mg.FigureRegistry(max_live_windows=2)
+    a, b = fr.figure(), fr.figure()
+    fr.show_all(block=False)
+    c = fr.figure()
+    fr.show_all(block=False)
+    # the least recently used window made room for the new Figure
+    assert [f.canvas.manager is not None for f in (a, b, c)] == [False, True, True]
+    assert fr.status(0)["promoted"] is False
+
+
+def test_max_live_windows_show_all_is_stable():
+    fr = mg.FigureRegistry(max_live_windows=2)
+    figs = [fr.figure() for _ in range(4)]
+
+    def promoted():
+        return [f.canvas.manager is not None for f in figs]
+
+    fr.show_all(block=False)
+    assert promoted() == [False, False, True, True]
+    fr.show_figure(0)
+    assert promoted()[0]
+    managers = [f.canvas.manager for f in figs[2:]]
+    # the newest Figures are shown again, no others lose their window
+    fr.show_all(block=False)
+    assert promoted() == [False, False, True, True]
+    assert figs[3].canvas.manager is managers[1]
+    fr.show_all(block=False)
+    assert promoted() == [False, False, True, True]
+    assert [f.canvas.manager for f in figs[2:]][1] is managers[1]
+
+
+def test_max_live_windows_weak_retain():
+    fr = mg.FigureRegistry(max_live_windows=1, retain="weak")
+    figs = [fr.figure(label="a"), fr.figure(label="b")]
+    fr.show_figure("a")
+    fr.show_figure("b")
+    del figs
+    gc.collect()
+    # "a" was demoted by the Registry, which keeps it until it is shown
+    assert fr.status("a")["promoted"] is False
+    fig = fr.show_figure("a")
+    assert fig.canvas.manager is not None
+    assert fr.status("b")["promoted"] is False
+    del fig
+    gc.collect()
+    assert sorted(fr.by_label) == ["a", "b"]
@@ -0,0 +1,126 @@
+import time
+
+import pytest
+
+import mpl_gui as mg
+from mpl_gui._patched_backends import headless
+from mpl_gui._promotion import promote_figure
+
+from .conftest import TestingBackend
+
+
+@pytest.fixture
+def headless_backend():
+    backend = mg.select_gui_toolkit("headless")
+    headless.calls.reset()
+    yield backend
+    mg.select_gui_toolkit(TestingBackend)
+
+
+def test_headless_registry_workflow(headless_backend):
+    fr = mg.FigureRegistry(block=True)
+    figs = [fr.figure() for _ in range(50)]
+    assert all(f.canvas.manager is None for f in figs)
+    fr.show_all()
+    assert all(isinstance(f.canvas.manager, headless_backend.FigureManager) for f in figs)
+    assert headless.calls.counts["show"] == 50
+    assert headless.calls.counts["mainloop"] == 1
+    assert set(headless.calls.seconds) >= {"show", "draw", "draw_idle", "mainloop"}
+
+    fr.close_all()
+    assert headless.calls.counts["destroy"] == 50
+    assert not fr.figures
+
+
+def test_headless_timers(headless_backend):
+    fig = mg.Figure()
+    mg.display(fig, block=False)
+    fired = []
+    timer = fig.canvas.new_timer(interval=1)
+    timer.single_shot = True
+    timer.add_callback(fired.append, 1)
+    timer.start()
+    assert fired == []
+    time.sleep(0.01)
+    fig.canvas.flush_events()
+    assert fired == [1]
+    fig.canvas.flush_events()
+    assert fired == [1]
+
+
+def test_backend_class_is_cached(headless_backend):
+    fig = mg.Figure()
+    mg.display(fig, block=False)
+    manager = fig.canvas.manager
+
+    assert mg.select_gui_toolkit("agg") is mg.select_gui_toolkit("AGG")
+    assert mg.select_gui_toolkit("Headless") is headless_backend
+    # the manager made before the switch is still the right type
+    mg.display(fig, block=False)
+    assert promote_figure(fig, num=None) is manager
+
+
+def test_tabbed_window(headless_backend, tabbed_window):
+    fr = mg.FigureRegistry(block=True)
+    figs = [fr.figure() for _ in range(10)]
+    fr.show_all()
+    managers = [f.canvas.manager for f in figs]
+    (window,) = {m.tab_window for m in managers}
+    assert window.managers == managers
+    assert headless.calls.counts["new_tab"] == 10
+    assert headless.calls.counts["show_window"] == 1
+    # only the selected (last shown) tab was drawn
+    assert window.selected is managers[-1]
+    assert headless.calls.counts["draw"] == 1
+    assert managers[0].get_window_title() == "Figure 0"
+
+    # the others are drawn when selected
+    managers[0].show()
+    assert window.selected is managers[0]
+    assert headless.calls.counts["draw"] == 2
+
+    # closing removes the tab, and the window with the last one
+    fr.close(0)
+    assert window.selected is managers[-1]
+    assert len(window.managers) == 9
+    fr.close_all()
+    assert window.closed
+    assert headless.calls.counts["destroy_window"] == 1
+
+    # a new window is made for the next Figure
+    fig = fr.figure()
+    fr.show_all()
+    assert fig.canvas.manager.tab_window is not window
+
+
+def test_headless_draw_event(headless_backend):
+    fr = mg.FigureRegistry(block=True)
+    fig = fr.figure()
+    events = []
+    fig.canvas.mpl_connect("draw_event", events.append)
+    fr.show_all()
+    assert [e.canvas for e in events] == [fig.canvas]
+    status = fr.status(fig)
+    assert status["draw_count"] == 1
+    assert status["last_draw"] is not None
+
+
+def test_show_all_is_incremental(headless_backend):
+    fr = mg.FigureRegistry(block=True)
+    figs = [fr.figure() for _ in range(5)]
+    fr.show_all()
+    assert headless.calls.counts["show"] == 5
+    assert headless.calls.counts["draw"] == 5
+
+    # nothing new and nothing changed
+    fr.show_all()
+    assert headless.calls.counts["show"] == 5
+    assert headless.calls.counts["draw"] == 5
+
+    # only the new Figure is shown and only it and the changed one drawn
+    figs[0].suptitle("changed")
+    fr.figure()
+    fr.show_all()
+    assert headless.calls.counts["show"] == 6
+    assert headless.calls.counts["draw"] == 7
+    assert headless.calls.counts["mainloop"] == 3
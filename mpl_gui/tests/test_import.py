@@ -0,0 +1,107 @@
+from pathlib import Path
+import subprocess
+import sys
+import textwrap
+
+import mpl_gui
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        check=True,
+        # so that the package under test is found first
+        cwd=Path(mpl_gui.__file__).parents[1],
+    ).stdout
+
+
+def test_import_does_not_start_subprocesses():
+    out = _run(
+        """
+        import sys
+
+        started = []
+
+
+        def hook(event, args):
+            if event in ("subprocess.Popen", "os.posix_spawn", "os.fork", "os.exec"):
+                started.append(event)
+
+
+        sys.addaudithook(hook)
+        import mpl_gui  # noqa
+        print(started)
+        """
+    )
+    assert out.strip() == "[]"
+
+
+def test_version_is_lazy():
+    out = _run(
+        """
+        import mpl_gui
+        assert "__version__" not in vars(mpl_gui)
+        print(mpl_gui.__version__ == mpl_gui.__version__)
+        assert "__version__" in vars(mpl_gui)
+        """
+    )
+    assert out.strip() == "True"
+
+
+def test_import_time():
+    # -X importtime writes "import time: self [us] | cumulative | name" lines
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import mpl_gui"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(mpl_gui.__file__).parents[1],
+    )
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        _, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if cumulative_us.strip().isdigit():
+            cumulative[name.strip()] = int(cumulative_us)
+    # nothing but mpl_gui itself should be imported, not even Matplotlib
+    assert "matplotlib" not in cumulative
+    assert cumulative["mpl_gui"] < 50_000
+
+
+def test_lazy_names_import_only_what_they_need():
+    out = _run(
+        """
+        import sys
+        import mpl_gui
+
+        mpl_gui.ion
+        print(sorted(m for m in sys.modules if m.startswith("mpl_gui.")))
+        """
+    )
+    assert out.strip() == "['mpl_gui._manage_interactive']"
+
+
+def test_prewarm():
+    out = _run(
+        """
+        import sys
+        import mpl_gui
+
+        mpl_gui.prewarm("headless").join()
+        print(
+            all(
+                m in sys.modules
+                for m in [
+                    "mpl_gui._registry",
+                    "matplotlib.font_manager",
+                    "matplotlib.backends.backend_agg",
+                    "mpl_gui._patched_backends.headless",
+                ]
+            )
+        )
+        # nothing was selected
+        print(mpl_gui._manage_backend._backend_mod)
+        """
+    )
+    assert out.split() == ["True", "None"]
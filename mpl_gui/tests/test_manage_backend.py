@@ -0,0 +1,138 @@
+import logging
+import sys
+from types import SimpleNamespace
+
+from matplotlib import cbook, rcsetup
+import pytest
+
+import mpl_gui as mg
+from mpl_gui import _manage_backend
+
+from .conftest import TestingBackend
+
+
+@pytest.fixture
+def restore_backend():
+    yield
+    mg.select_gui_toolkit(TestingBackend)
+
+
+@pytest.mark.parametrize(
+    "env, platform, candidate, reason",
+    [
+        ({}, "linux", "tkagg", "neither DISPLAY nor WAYLAND_DISPLAY"),
+        ({"DISPLAY": ":0"}, "linux", "macosx", "not on macOS"),
+        ({"WAYLAND_DISPLAY": "wayland-0"}, "linux", "wxagg", "none of wx"),
+        ({"QT_QPA_PLATFORM": "offscreen"}, "linux", "qtagg", "none of PyQt6"),
+        ({}, "win32", "gtk3agg", "none of gi"),
+        ({}, "linux", "agg", None),
+    ],
+)
+def test_probe(monkeypatch, env, platform, candidate, reason):
+    for k in ["DISPLAY", "WAYLAND_DISPLAY", "QT_QPA_PLATFORM"]:
+        monkeypatch.delenv(k, raising=False)
+    for k, v in env.items():
+        monkeypatch.setenv(k, v)
+    monkeypatch.setattr(sys, "platform", platform)
+    # pretend only tkinter is installed
+    monkeypatch.setattr(
+        _manage_backend.importlib.util,
+        "find_spec",
+        lambda name: object() if name == "_tkinter" else None,
+    )
+    result = _manage_backend._probe(candidate)
+    if reason is None:
+        assert result is None
+    else:
+        assert reason in result
+
+
+def test_auto_backend_skips_without_import(monkeypatch, caplog, restore_backend):
+    monkeypatch.delenv("DISPLAY", raising=False)
+    monkeypatch.delenv("WAYLAND_DISPLAY", raising=False)
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setattr(cbook, "_get_running_interactive_framework", lambda: None)
+
+    def no_import(name):
+        raise AssertionError(f"tried to import {name}")
+
+    monkeypatch.setattr(_manage_backend, "_build_backend_class", no_import)
+    monkeypatch.setitem(_manage_backend._backend_cache, "agg", (TestingBackend, "agg"))
+
+    with caplog.at_level(logging.DEBUG, logger=_manage_backend.__name__):
+        assert mg.select_gui_toolkit(rcsetup._auto_backend_sentinel) is TestingBackend
+    skipped = [r.args[0] for r in caplog.records if r.msg.startswith("Skipped")]
+    assert skipped == ["macosx", "qtagg", "gtk3agg", "tkagg", "wxagg"]
+
+
+def test_auto_backend_running_framework(monkeypatch, caplog, restore_backend):
+    # e.g. a Tk event loop on a platform without DISPLAY, which _probe would
+    # reject
+    monkeypatch.delenv("DISPLAY", raising=False)
+    monkeypatch.delenv("WAYLAND_DISPLAY", raising=False)
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setattr(cbook, "_get_running_interactive_framework", lambda: "tk")
+    monkeypatch.setattr(_manage_backend, "_backend_cache", {})
+    built = []
+
+    def fake_build(name):
+        built.append(name)
+        return TestingBackend, "agg"
+
+    monkeypatch.setattr(_manage_backend, "_build_backend_class", fake_build)
+
+    with caplog.at_level(logging.DEBUG, logger=_manage_backend.__name__):
+        assert mg.select_gui_toolkit(rcsetup._auto_backend_sentinel) is TestingBackend
+    assert built == ["tkagg"]
+    assert not [r for r in caplog.records if r.msg.startswith("Skipped")]
+
+
+def test_toolkit_cache(monkeypatch, tmp_path, restore_backend):
+    cache = tmp_path / "toolkit.json"
+    monkeypatch.setattr(_manage_backend, "_toolkit_cache_path", lambda: str(cache))
+    monkeypatch.setenv("DISPLAY", ":0")
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setattr(cbook, "_get_running_interactive_framework", lambda: None)
+    monkeypatch.setattr(
+        _manage_backend.importlib.util,
+        "find_spec",
+        lambda name: SimpleNamespace(origin=None) if name in ("gi", "_tkinter") else None,
+    )
+    monkeypatch.setattr(_manage_backend, "_backend_cache", {})
+    built = []
+
+    def fake_build(name):
+        built.append(name)
+        if name != "tkagg":
+            raise ImportError(name)
+        return TestingBackend, "agg"
+
+    monkeypatch.setattr(_manage_backend, "_build_backend_class", fake_build)
+
+    def select():
+        built.clear()
+        _manage_backend._backend_cache.clear()
+        return mg.select_gui_toolkit(rcsetup._auto_backend_sentinel)
+
+    # not opted in
+    monkeypatch.delenv("MPLGUI_TOOLKIT_CACHE", raising=False)
+    select()
+    assert built == ["gtk3agg", "tkagg"]
+    assert not cache.exists()
+
+    monkeypatch.setenv("MPLGUI_TOOLKIT_CACHE", "1")
+    select()
+    assert built == ["gtk3agg", "tkagg"]
+    assert cache.exists()
+    # only the toolkit that works is imported now
+    assert select() is TestingBackend
+    assert built == ["tkagg"]
+
+    # a different display invalidates the cache
+    monkeypatch.setenv("DISPLAY", ":1")
+    select()
+    assert built == ["gtk3agg", "tkagg"]
+
+    cache.write_text("not json")
+    select()
+    assert built == ["gtk3agg", "tkagg"]
@@ -0,0 +1,45 @@
+import pytest
+
+import mpl_gui as mg
+
+from .conftest import TestingBackend
+
+tk = pytest.importorskip("tkinter")
+
+
+@pytest.fixture
+def tkagg_backend():
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"Tk can not open a window: {e}")
+    root.destroy()
+    backend = mg.select_gui_toolkit("tkagg")
+    yield backend
+    mg.select_gui_toolkit(TestingBackend)
+
+
+def test_tabbed_window(tkagg_backend, tabbed_window):
+    fr = mg.FigureRegistry(block=False)
+    figs = [fr.figure() for _ in range(3)]
+    fr.show_all()
+    managers = [f.canvas.manager for f in figs]
+    (window,) = {m.tab_window for m in managers}
+    assert window.managers == managers
+    assert window.notebook.index("end") == 3
+    assert window.selected is managers[-1]
+    assert window.notebook.select() == str(managers[-1].frame)
+    assert window.notebook.tab(managers[0].frame, "text") == "Figure 0"
+    # every tab shares the DPI tracking of the window
+    assert all(m._window_dpi is window.window_dpi for m in managers)
+
+    managers[0].show()
+    assert window.notebook.select() == str(managers[0].frame)
+    assert window.selected is managers[0]
+
+    fr.close(figs[0])
+    assert window.notebook.index("end") == 2
+    assert not managers[0]._window_dpi_cbname
+    fr.close_all()
+    assert window.closed
+    window.window.update()